@@ -1,4 +1,51 @@
 __version__ = "0.1.1"
 
+from importlib import import_module
+
 from . import logging
-from .api import *
+
+# Public api is resolved lazily (PEP 562) so importing snapflow, eg for the `pipe`
+# decorator, doesn't pull in the whole environment / storage / pandas stack
+_lazy_exports = {
+    "operators": "snapflow.core.operators",
+    "DataBlock": "snapflow.core.data_block",
+    "Environment": "snapflow.core.environment",
+    "current_env": "snapflow.core.environment",
+    "produce": "snapflow.core.environment",
+    "run_graph": "snapflow.core.environment",
+    "run_node": "snapflow.core.environment",
+    "PipeContext": "snapflow.core.execution",
+    "DeclaredGraph": "snapflow.core.graph",
+    "Graph": "snapflow.core.graph",
+    "graph": "snapflow.core.graph",
+    "SnapflowModule": "snapflow.core.module",
+    "DeclaredNode": "snapflow.core.node",
+    "Node": "snapflow.core.node",
+    "node": "snapflow.core.node",
+    "Pipe": "snapflow.core.pipe",
+    "pipe": "snapflow.core.pipe",
+    "sql_pipe": "snapflow.core.sql.pipe",
+    "DataBlockStream": "snapflow.core.streams",
+    "StreamBuilder": "snapflow.core.streams",
+    "Schema": "snapflow.schema",
+    "DataFormat": "snapflow.storage.data_formats",
+    "DataFrameIterator": "snapflow.storage.data_formats",
+    "Records": "snapflow.storage.data_formats",
+    "RecordsIterator": "snapflow.storage.data_formats",
+    "Storage": "snapflow.storage.storage",
+}
+
+__all__ = list(_lazy_exports)
+
+
+def __getattr__(name: str):
+    if name not in _lazy_exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(_lazy_exports[name])
+    obj = module if name == "operators" else getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
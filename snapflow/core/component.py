@@ -43,6 +43,7 @@ class ComponentLibrary:
 
         self.pipes = {}
         self.schemas = {}
+        self._views: Dict[str, AttrDict] = {}
         self.module_lookup_names = [DEFAULT_LOCAL_MODULE_NAME]
         if module_lookup_keys:
             for k in module_lookup_keys:
@@ -57,9 +58,19 @@ class ComponentLibrary:
 
     def add_pipe(self, p: Pipe):
         self.pipes[p.key] = p
+        self._views.clear()
 
     def add_schema(self, schema: Schema):
         self.schemas[schema.key] = schema
+        self._views.clear()
+
+    def add_pipes(self, pipes: Iterable[Pipe]):
+        self.pipes.update((p.key, p) for p in pipes)
+        self._views.clear()
+
+    def add_schemas(self, schemas: Iterable[Schema]):
+        self.schemas.update((s.key, s) for s in schemas)
+        self._views.clear()
 
     def get_pipe(self, pipe_like: Union[Pipe, str], try_module_lookups=True) -> Pipe:
         from snapflow.core.pipe import Pipe
@@ -110,6 +121,7 @@ class ComponentLibrary:
     def merge(self, other: ComponentLibrary):
         self.pipes.update(other.pipes)
         self.schemas.update(other.schemas)
+        self._views.clear()
         for k in other.module_lookup_names:
             self.add_module_name(k)
 
@@ -121,7 +133,12 @@ class ComponentLibrary:
         return ad
 
     def get_pipes_view(self) -> AttrDict[str, Pipe]:
-        return self.get_view(self.pipes)
+        # Views are hit on every `module.pipes.x` access, so build once per change
+        if "pipes" not in self._views:
+            self._views["pipes"] = self.get_view(self.pipes)
+        return self._views["pipes"]
 
     def get_schemas_view(self) -> AttrDict[str, Schema]:
-        return self.get_view(self.schemas)
+        if "schemas" not in self._views:
+            self._views["schemas"] = self.get_view(self.schemas)
+        return self._views["schemas"]
@@ -189,7 +189,7 @@ class StoredDataBlockMetadata(BaseModel):
     data_block_id = Column(
         String(128), ForeignKey(DataBlockMetadata.id), nullable=False
     )
-    storage_url = Column(String(128), nullable=False)
+    storage_url = Column(String(128), nullable=False, index=True)
     data_format: DataFormat = Column(ClassBasedEnumSqlalchemyType, nullable=False)  # type: ignore
     # is_ephemeral = Column(Boolean, default=False) # TODO
     # Hints
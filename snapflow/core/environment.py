@@ -5,7 +5,7 @@ import os
 from contextlib import contextmanager
 from dataclasses import asdict
 from importlib import import_module
-from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import strictyaml
 from loguru import logger
@@ -13,10 +13,15 @@ from snapflow.core.component import ComponentLibrary
 from snapflow.core.metadata.orm import BaseModel
 from snapflow.core.module import DEFAULT_LOCAL_MODULE, SnapflowModule
 from snapflow.schema.base import GeneratedSchema, Schema, SchemaLike
+from snapflow.storage.db.api import DatabaseApi
 from snapflow.storage.storage import DatabaseStorageClass, PythonStorageClass
-from sqlalchemy.orm import Session, sessionmaker
+from snapflow.utils.common import rand_str
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, configure_mappers, sessionmaker
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
     from snapflow.storage.storage import Storage
     from snapflow.core.pipe import Pipe
     from snapflow.core.node import Node, NodeLike
@@ -27,10 +32,30 @@ if TYPE_CHECKING:
 DEFAULT_METADATA_STORAGE_URL = "sqlite://"  # in-memory sqlite
 
 
+def is_file_sqlite(eng: Engine) -> bool:
+    db_file = eng.url.database
+    return eng.dialect.name == "sqlite" and bool(db_file) and db_file != ":memory:"
+
+
+def set_sqlite_metadata_pragmas(dbapi_conn, connection_record):
+    # Default rollback journal + FULL sync pays an fsync per metadata commit
+    cursor = dbapi_conn.cursor()
+    # Only takes effect on a fresh db (must precede table creation), no-op otherwise
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA wal_autocheckpoint=1000")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
 class Environment:
     library: ComponentLibrary
     storages: List[Storage]
     metadata_storage: Storage
+    _metadata_engine: Engine
 
     def __init__(
         self,
@@ -41,7 +66,6 @@ class Environment:
     ):
         from snapflow.core.runtime import Runtime, LocalPythonRuntimeEngine
         from snapflow.storage.storage import Storage, new_local_python_storage
-        from snapflow.modules import core
 
         self.name = name
         if metadata_storage is None:
@@ -60,6 +84,10 @@ class Environment:
         self.storages = []
         self.runtimes = []
         self._metadata_sessions: List[Session] = []
+        # Schema keys known to be neither in the library nor generated
+        self._missing_schema_keys: Set[str] = set()
+        # In-memory DataFrames handed to pipes by reference (see `register_dataframe`)
+        self._dataframe_registry: Dict[str, DataFrame] = {}
         # if add_default_python_runtime:
         #     self.runtimes.append(
         #         Runtime(
@@ -68,6 +96,9 @@ class Environment:
         #         )
         #     )
         if initial_modules is None:
+            # Only pay for importing the core pipes when they're actually used
+            from snapflow.modules import core
+
             initial_modules = [core]
         for m in initial_modules:
             self.add_module(m)
@@ -77,15 +108,47 @@ class Environment:
         self.runtimes.append(Runtime.from_storage(self._local_python_storage))
 
     def initialize_metadata_database(self):
+        # All ORM models must be registered before tables are created or any
+        # session is used, whether or not the core module is loaded
+        import snapflow.core.data_block  # noqa: F401
+        import snapflow.core.graph  # noqa: F401
+        import snapflow.core.node  # noqa: F401
+
+        configure_mappers()
         if not issubclass(
             self.metadata_storage.storage_engine.storage_class, DatabaseStorageClass
         ):
             raise ValueError(
                 f"metadata storage expected a database, got {self.metadata_storage}"
             )
-        conn = self.metadata_storage.get_api().get_engine()
-        BaseModel.metadata.create_all(conn)
-        self.Session = sessionmaker(bind=conn)
+        api = self.metadata_storage.get_api()
+        assert isinstance(api, DatabaseApi)
+        # Resolve the engine once: every metadata session binds to it, and the
+        # pragmas must be registered on it (in-memory sqlite engines aren't
+        # shared, so a later `get_api().get_engine()` may be a different db)
+        eng = api.get_engine()
+        if is_file_sqlite(eng) and not event.contains(
+            eng, "connect", set_sqlite_metadata_pragmas
+        ):
+            event.listen(eng, "connect", set_sqlite_metadata_pragmas)
+        BaseModel.metadata.create_all(eng)
+        self._metadata_engine = eng
+        self.Session: sessionmaker = sessionmaker(bind=eng)
+
+    def checkpoint_metadata(self):
+        # Return freed pages to the OS and truncate the WAL after bulk deletes
+        eng = self._metadata_engine
+        if not is_file_sqlite(eng):
+            return
+        conn = eng.raw_connection()
+        try:
+            cursor = conn.cursor()
+            # incremental_vacuum frees one page per step, so must be fully consumed
+            cursor.execute("PRAGMA incremental_vacuum").fetchall()
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            cursor.close()
+        finally:
+            conn.close()
 
     def _get_new_metadata_session(self) -> Session:
         sess = self.Session()
@@ -106,6 +169,19 @@ class Environment:
     def get_default_local_python_storage(self) -> Storage:
         return self._local_python_storage
 
+    def register_dataframe(self, df: DataFrame) -> str:
+        # Pass the returned ref in pipe config instead of the DataFrame itself,
+        # config is logged (serialized) with every pipe run
+        ref = rand_str(12)
+        self._dataframe_registry[ref] = df
+        return ref
+
+    def get_registered_dataframe(self, ref: str) -> DataFrame:
+        return self._dataframe_registry[ref]
+
+    def unregister_dataframe(self, ref: str):
+        self._dataframe_registry.pop(ref, None)
+
     def get_local_module(self) -> SnapflowModule:
         return self._local_module
 
@@ -118,13 +194,19 @@ class Environment:
         try:
             return self.library.get_schema(schema_like)
         except KeyError:
+            if schema_like in self._missing_schema_keys:
+                raise KeyError(schema_like)
             schema = self.get_generated_schema(schema_like, sess=sess)
             if schema is None:
+                self._missing_schema_keys.add(schema_like)
                 raise KeyError(schema_like)
+            # Register so later lookups don't go back to the db
+            self.library.add_schema(schema)
             return schema
 
     def add_schema(self, schema: Schema):
         self.library.add_schema(schema)
+        self._missing_schema_keys.clear()
 
     def get_generated_schema(
         self, schema_like: SchemaLike, sess: Session
@@ -135,20 +217,25 @@ class Environment:
             key = schema_like.key
         else:
             raise TypeError(schema_like)
-        got = sess.query(GeneratedSchema).get(key)
-        if got is None:
+        # Only the definition column, no need to load (and track) the ORM object
+        definition = (
+            sess.query(GeneratedSchema.definition)
+            .filter(GeneratedSchema.key == key)
+            .scalar()
+        )
+        if definition is None:
             return None
-        return got.as_schema()
+        return Schema.from_dict(definition)
 
     def add_new_generated_schema(self, schema: Schema, sess: Session):
-        logger.debug(f"Adding new generated schema {schema}")
+        logger.debug("Adding new generated schema {}", schema)
         if schema.key in self.library.schemas:
             # Already exists
             return
         got = GeneratedSchema(key=schema.key, definition=asdict(schema))
         sess.add(got)
         sess.flush([got])
-        self.library.add_schema(schema)
+        self.add_schema(schema)
 
     def all_schemas(self) -> List[Schema]:
         return self.library.all_schemas()
@@ -165,6 +252,7 @@ class Environment:
     def add_module(self, *modules: SnapflowModule):
         for module in modules:
             self.library.add_module(module)
+        self._missing_schema_keys.clear()
 
     @contextmanager
     def session_scope(self, **kwargs):
@@ -208,7 +296,6 @@ class Environment:
         args = dict(
             graph=graph,
             env=self,
-            # metadata_session=sess,
             runtimes=self.runtimes,
             storages=self.storages,
             target_storage=target_storage,
@@ -226,7 +313,7 @@ class Environment:
         # self.session.begin_nested()
         ec = self.get_run_context(graph, target_storage=target_storage, **kwargs)
         em = ExecutionManager(ec)
-        logger.debug(f"executing on graph {graph.adjacency_list()}")
+        logger.opt(lazy=True).debug("executing on graph {}", graph.adjacency_list)
         try:
             yield em
             # self.session.commit()
@@ -307,6 +394,7 @@ class Environment:
         self,
         graph: Union[Graph, DeclaredGraph],
         to_exhaustion: bool = True,
+        commit_each_node: bool = False,
         **execution_kwargs: Any,
     ):
         from snapflow.core.graph import DeclaredGraph
@@ -314,9 +402,26 @@ class Environment:
         if isinstance(graph, DeclaredGraph):
             graph = graph.instantiate(self)
         nodes = graph.get_all_nodes_in_execution_order()
-        with self.run(graph, **execution_kwargs) as em:
-            for node in nodes:
-                em.execute(node, to_exhaustion=to_exhaustion)
+        if commit_each_node:
+            with self.run(graph, **execution_kwargs) as em:
+                for node in nodes:
+                    em.execute(node, to_exhaustion=to_exhaustion)
+            return
+        # One metadata session for the whole graph, committed once per node
+        # instead of once per pipe run. A failing node only rolls back its own
+        # uncommitted work, completed nodes are kept
+        sess = self.Session()
+        try:
+            with self.run(graph, metadata_session=sess, **execution_kwargs) as em:
+                for node in nodes:
+                    try:
+                        em.execute(node, to_exhaustion=to_exhaustion)
+                    except Exception:
+                        sess.rollback()
+                        raise
+                    sess.commit()
+        finally:
+            sess.close()
 
     def latest_output(self, node: NodeLike) -> Optional[DataBlock]:
         sess = self._get_new_metadata_session()  # hanging session
@@ -349,41 +454,63 @@ class Environment:
                 pass
         return sr
 
-    # def validate_and_clean_data_blocks(
-    #     self, delete_memory=True, delete_intermediate=False, force: bool = False
-    # ):
-    #     from snapflow.core.data_block import (
-    #         DataBlockMetadata,
-    #         StoredDataBlockMetadata,
-    #     )
-
-    #     if delete_memory:
-    #         deleted = (
-    #             self.session.query(StoredDataBlockMetadata)
-    #             .filter(StoredDataBlockMetadata.storage_url.startswith("memory:"))
-    #             .delete(False)
-    #         )
-    #         print(f"{deleted} Memory StoredDataBlocks deleted")
-
-    #     for block in self.session.query(DataBlockMetadata).filter(
-    #         ~DataBlockMetadata.stored_data_blocks.any()
-    #     ):
-    #         print(f"#{block.id} {block.nominal_schema_key} is orphaned! SAD")
-    #     if delete_intermediate:
-    #         # TODO: does no checking if they are unprocessed or not...
-    #         if not force:
-    #             d = input(
-    #                 "Are you sure you want to delete ALL intermediate DataBlocks? There is no undoing this operation. y/N?"
-    #             )
-    #             if not d or d.lower()[0] != "y":
-    #                 return
-    #         # Delete blocks with no DataSet
-    #         cnt = (
-    #             self.session.query(DataBlockMetadata)
-    #             .filter(~DataBlockMetadata.data_sets.any(),)
-    #             .update({DataBlockMetadata.deleted: True}, synchronize_session=False)
-    #         )
-    #         print(f"{cnt} intermediate DataBlocks deleted")
+    def validate_and_clean_data_blocks(
+        self, delete_memory: bool = True, dry_run: bool = False
+    ) -> Optional[Dict[str, int]]:
+        from snapflow.core.data_block import (
+            DataBlockMetadata,
+            StoredDataBlockMetadata,
+        )
+        from snapflow.storage.storage import LocalPythonStorageEngine
+
+        # Memory storage does not outlive the process, so its records can go
+        memory_blocks = or_(
+            *[
+                StoredDataBlockMetadata.storage_url.like(f"{scheme}://%")
+                for scheme in LocalPythonStorageEngine.schemes
+            ]
+        )
+        orphaned = ~DataBlockMetadata.stored_data_blocks.any()
+        if dry_run:
+            # Only count what would be cleaned, nothing is written
+            counts = {"memory_stored_data_blocks": 0, "orphaned_data_blocks": 0}
+            with self.session_scope() as sess:
+                if delete_memory:
+                    counts["memory_stored_data_blocks"] = sess.execute(
+                        select([func.count()])
+                        .select_from(StoredDataBlockMetadata.__table__)
+                        .where(memory_blocks)
+                    ).scalar()
+                counts["orphaned_data_blocks"] = sess.execute(
+                    select([func.count()])
+                    .select_from(DataBlockMetadata.__table__)
+                    .where(orphaned)
+                ).scalar()
+            logger.debug("Would clean {}", counts)
+            return counts
+
+        if delete_memory:
+            with self.session_scope() as sess:
+                # One bulk statement (bypasses the session, no sync needed)
+                res = sess.execute(
+                    StoredDataBlockMetadata.__table__.delete().where(memory_blocks)
+                )
+                logger.debug("{} Memory StoredDataBlocks deleted", res.rowcount)
+
+        def orphaned_block_ids() -> List[str]:
+            with self.session_scope() as sess:
+                rows = sess.execute(
+                    select([DataBlockMetadata.id]).where(orphaned).limit(100)
+                )
+                return [block_id for (block_id,) in rows]
+
+        # Only queried if debug logging is enabled
+        logger.opt(lazy=True).debug(
+            "Orphaned DataBlocks (first 100): {}", orphaned_block_ids
+        )
+        if delete_memory:
+            self.checkpoint_metadata()
+        return None
 
 
 # Shortcuts
@@ -453,22 +580,30 @@ def load_environment_from_project(project: Any) -> Environment:
     )
     for url in getattr(project, "storages", []):
         env.add_storage(Storage.from_url(url))
-    for module_name in getattr(project, "modules", []):
-        m = import_module(module_name)
-        env.add_module(m)  # type: ignore  # We hijack the module
+    modules = [import_module(m) for m in getattr(project, "modules", [])]
+    env.add_module(*modules)  # type: ignore  # We hijack the module
     return env
 
 
+_project_environments: Dict[str, Environment] = {}
+
+
 def current_env(cfg_module: str = None) -> Optional[Environment]:
     import sys
     from snapflow.project.project import SNAPFLOW_PROJECT_PACKAGE_NAME
 
     if cfg_module is None:
         cfg_module = SNAPFLOW_PROJECT_PACKAGE_NAME
-    sys.path.append(os.getcwd())
+    if cfg_module in _project_environments:
+        return _project_environments[cfg_module]
+    cwd = os.getcwd()
+    if cwd not in sys.path:
+        sys.path.append(cwd)
     try:
         cfg = import_module(cfg_module)
-        return load_environment_from_project(cfg)
+        env = load_environment_from_project(cfg)
+        _project_environments[cfg_module] = env
+        return env
     except ImportError:
         pass
     # with open(cfg_file) as f:
@@ -122,11 +122,11 @@ class ExecutionSession:
         self.metadata_session.add(drl)
 
     def log_input(self, block: DataBlockMetadata):
-        logger.debug(f"Input logged: {block}")
+        logger.debug("Input logged: {}", block)
         self.log(block, Direction.INPUT)
 
     def log_output(self, block: DataBlockMetadata):
-        logger.debug(f"Output logged: {block}")
+        logger.debug("Output logged: {}", block)
         self.log(block, Direction.OUTPUT)
 
 
@@ -160,12 +160,13 @@ def validate_data_blocks(sess: Session):
 class RunContext:
     env: Environment
     graph: Graph
-    # metadata_session: Session
     storages: List[Storage]
     runtimes: List[Runtime]
     target_storage: Storage
     local_python_storage: Storage
     current_runtime: Optional[Runtime] = None
+    # Shared across pipe runs (eg by `run_graph`), otherwise each run commits its own
+    metadata_session: Optional[Session] = None
     node_timelimit_seconds: Optional[
         int
     ] = None  # TODO: this is a "soft" limit, could imagine a "hard" one too
@@ -176,7 +177,7 @@ class RunContext:
         args = dict(
             graph=self.graph,
             env=self.env,
-            # metadata_session=self.metadata_session,
+            metadata_session=self.metadata_session,
             storages=self.storages,
             runtimes=self.runtimes,
             target_storage=self.target_storage,
@@ -189,12 +190,21 @@ class RunContext:
         args.update(**kwargs)
         return RunContext(**args)  # type: ignore
 
+    @contextmanager
+    def metadata_session_scope(self) -> Iterator[Session]:
+        if self.metadata_session is None:
+            with self.env.session_scope() as sess:
+                yield sess
+            return
+        # Shared session: its owner commits (or rolls back) once per node
+        yield self.metadata_session
+
     @contextmanager
     def start_pipe_run(self, node: Node) -> Iterator[ExecutionSession]:
         from snapflow.core.graph import GraphMetadata
 
         assert self.current_runtime is not None, "Runtime not set"
-        with self.env.session_scope() as sess:
+        with self.metadata_session_scope() as sess:
             node_state = node.get_state(sess) or {}
             new_graph_meta = node.graph.get_metadata_obj()
             graph_meta = sess.query(GraphMetadata).get(new_graph_meta.hash)
@@ -345,7 +355,7 @@ class ExecutionManager:
         base_msg = f"Running node {cf.bold(node.key)} {cf.dimmed(node.pipe.key)}\n"
         self.ctx.logger(base_msg)
         logger.debug(
-            f"RUNNING NODE {node.key} {node.pipe.key} with config `{node.config}`"
+            "RUNNING NODE {} {} with config `{}`", node.key, node.pipe.key, node.config
         )
         # self.log(base_msg)
         # start = time.time()
@@ -380,7 +390,7 @@ class ExecutionManager:
         # Or just merge in new session in env.produce
         if last_non_none_output is None:
             return None
-        logger.debug(f"*DONE* RUNNING NODE {node.key} {node.pipe.key}")
+        logger.debug("*DONE* RUNNING NODE {} {}", node.key, node.pipe.key)
         if output_session is not None:
             last_non_none_output = output_session.merge(last_non_none_output)
             return last_non_none_output.as_managed_data_block(run_ctx, output_session)
@@ -402,7 +412,10 @@ class ExecutionManager:
 
 def ensure_alias(sess: Session, node: Node, sdb: StoredDataBlockMetadata) -> Alias:
     logger.debug(
-        f"Creating alias {node.get_alias()} for node {node.key} on storage {sdb.storage_url}"
+        "Creating alias {} for node {} on storage {}",
+        node.get_alias(),
+        node.key,
+        sdb.storage_url,
     )
     return sdb.create_alias(sess, node.get_alias())
 
@@ -526,7 +539,9 @@ class Worker:
                 execution_session.metadata_session,
             )  # TODO: could check output to see if it is LocalRecords with a schema too?
             logger.debug(
-                f"Resolved output schema {nominal_output_schema} {executable.bound_interface}"
+                "Resolved output schema {} {}",
+                nominal_output_schema,
+                executable.bound_interface,
             )
             output_obj = wrap_records_object(output_obj)
             if records_object_is_definitely_empty(output_obj):
@@ -120,6 +120,10 @@ class Graph:
     def __init__(self, env: Environment, nodes: Iterable[Node] = None):
         self.env = env
         self._nodes: Dict[str, Node] = {}
+        # Derived from the nodes, reset whenever nodes are added or removed
+        self._nx_graph: Optional[nx.DiGraph] = None
+        self._adjacency: Optional[List[Tuple[str, Dict]]] = None
+        self._execution_order: Optional[List[str]] = None
         if nodes:
             for n in nodes:
                 self.add_node(n)
@@ -128,6 +132,11 @@ class Graph:
         s = "Nodes:\n------\n" + "\n".join(self._nodes.keys())
         return s
 
+    def _reset_derived(self):
+        self._nx_graph = None
+        self._adjacency = None
+        self._execution_order = None
+
     def get_metadata_obj(self) -> GraphMetadata:
         adjacency = self.adjacency_list()
         return GraphMetadata(hash=hash_adjacency(adjacency), adjacency=adjacency)
@@ -162,9 +171,11 @@ class Graph:
         if node.key in self._nodes:
             raise KeyError(f"Duplicate node key {node.key}")
         self._nodes[node.key] = node
+        self._reset_derived()
 
     def remove_node(self, node: Node):
         del self._nodes[node.key]
+        self._reset_derived()
 
     def get_node(self, key: NodeLike) -> Node:
         if isinstance(key, Node):
@@ -189,6 +200,11 @@ class Graph:
         return True
 
     def as_nx_graph(self) -> nx.DiGraph:
+        if self._nx_graph is None:
+            self._nx_graph = self._build_nx_graph()
+        return self._nx_graph
+
+    def _build_nx_graph(self) -> nx.DiGraph:
         g = nx.DiGraph()
         for n in self.all_nodes():
             g.add_node(n.key)
@@ -201,7 +217,9 @@ class Graph:
         return g
 
     def adjacency_list(self):
-        return list(self.as_nx_graph().adjacency())
+        if self._adjacency is None:
+            self._adjacency = list(self.as_nx_graph().adjacency())
+        return self._adjacency
 
     def get_all_upstream_dependencies_in_execution_order(
         self, node: Node
@@ -227,5 +245,6 @@ class Graph:
         return remove_dupes(nodes)
 
     def get_all_nodes_in_execution_order(self) -> List[Node]:
-        g = self.as_nx_graph()
-        return [self.get_node(name) for name in nx.topological_sort(g)]
+        if self._execution_order is None:
+            self._execution_order = list(nx.topological_sort(self.as_nx_graph()))
+        return [self.get_node(name) for name in self._execution_order]
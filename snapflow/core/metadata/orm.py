@@ -1,18 +1,24 @@
-from collections import OrderedDict
-from typing import Any
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 from snapflow.utils.common import cf, rand_str, title_to_snake_case, utcnow
 from sqlalchemy import Column, DateTime, func
-from sqlalchemy.ext.declarative import declarative_base, declared_attr
+from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm.exc import DetachedInstanceError
 
 SNAPFLOW_METADATA_TABLE_PREFIX = "_snapflow_"
 
 
 class _BaseModel:
-    @declared_attr
-    def __tablename__(cls):
-        return SNAPFLOW_METADATA_TABLE_PREFIX + title_to_snake_case(cls.__name__)  # type: ignore
+    __tablename__: str
+    _column_keys_cache: ClassVar[Optional[Tuple[str, ...]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Set once at class creation, before declarative maps the class
+        super().__init_subclass__(**kwargs)  # type: ignore
+        cls.__tablename__ = SNAPFLOW_METADATA_TABLE_PREFIX + title_to_snake_case(
+            cls.__name__
+        )
 
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -47,11 +53,20 @@ class _BaseModel:
             return f"<{self.__class__.__name__}({fields_string})>"
         return f"<{self.__class__.__name__} {id(self)}>"
 
-    def _asdict(self):
-        result = OrderedDict()
-        for key in self.__mapper__.c.keys():  # type: ignore
-            result[key] = getattr(self, key)
-        return result
+    @classmethod
+    def _column_keys(cls) -> Tuple[str, ...]:
+        # Computed once per mapped class (not inherited from a parent class)
+        keys = cls.__dict__.get("_column_keys_cache")
+        if keys is None:
+            keys = tuple(cls.__mapper__.c.keys())  # type: ignore
+            cls._column_keys_cache = keys
+        return keys
+
+    def _asdict(self) -> Dict[str, Any]:
+        keys = self._column_keys()
+        if len(keys) == 1:
+            return {keys[0]: getattr(self, keys[0])}
+        return dict(zip(keys, attrgetter(*keys)(self)))
 
 
 BaseModel = declarative_base(cls=_BaseModel)  # type: Any
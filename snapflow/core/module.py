@@ -3,11 +3,14 @@ from __future__ import annotations
 import os
 import sys
 from contextlib import contextmanager
+from functools import lru_cache
 from io import TextIOBase
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Generator,
     Iterable,
     Iterator,
@@ -37,6 +40,53 @@ class ModuleException(Exception):
     pass
 
 
+@lru_cache(maxsize=256)
+def _read_file_cached(path: str, mtime_ns: int) -> str:
+    # mtime is part of the cache key so edited files are re-read
+    # Module files are small, so one raw read and decode beats the text io stack
+    with open(path, "rb", buffering=0) as f:
+        return f.read().decode("utf-8")
+
+
+def read_file_cached(path: str) -> str:
+    return _read_file_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _pipe_factories():
+    # Deferred to avoid circular imports, but only resolved once
+    from snapflow.core.pipe import Pipe, make_pipe
+    from snapflow.core.sql.pipe import sql_pipe
+
+    return Pipe, make_pipe, sql_pipe
+
+
+# Building a pipe inspects the callable's signature, so re-use them per module
+# name. Cached on the callable itself, so the pipes live exactly as long as it does
+_PIPE_CACHE_ATTR = "__snapflow_pipes__"
+
+
+def make_pipe_cached(pipe_like: Callable, module_name: str) -> Pipe:
+    _, make_pipe, _ = _pipe_factories()
+    pipes: Optional[Dict[str, Pipe]] = getattr(pipe_like, _PIPE_CACHE_ATTR, None)
+    if pipes is None:
+        pipes = {}
+        try:
+            setattr(pipe_like, _PIPE_CACHE_ATTR, pipes)
+        except (AttributeError, TypeError):
+            # No attribute dict (eg builtins), just don't cache
+            return make_pipe(pipe_like, module=module_name)
+    if module_name not in pipes:
+        pipes[module_name] = make_pipe(pipe_like, module=module_name)
+    return pipes[module_name]
+
+
+@lru_cache(maxsize=256)
+def sql_pipe_cached(name: str, module_name: str, sql: str) -> Pipe:
+    _, _, sql_pipe = _pipe_factories()
+    return sql_pipe(name=name, module=module_name, sql=sql)
+
+
 class SnapflowModule:
     name: str
     py_module_path: Optional[str]
@@ -66,10 +116,13 @@ class SnapflowModule:
         self.library = ComponentLibrary(module_lookup_keys=[self.name])
         self.test_cases = []
         self.dependencies = []
-        for schema in schemas or []:
-            self.add_schema(schema)
-        for fn in pipes or []:
-            self.add_pipe(fn)
+        processed_schemas = [self.process_schema(s) for s in schemas or []]
+        processed_pipes = [self.process_pipe(p) for p in pipes or []]
+        components: List[Any] = list(chain(processed_schemas, processed_pipes))
+        for c in components:
+            self.validate_key(c)
+        self.library.add_schemas(processed_schemas)
+        self.library.add_pipes(processed_pipes)
         for t in tests or []:
             self.add_test(t)
         for d in dependencies or []:
@@ -89,6 +142,11 @@ class SnapflowModule:
         with open(typedef_path) as f:
             yield f
 
+    def read_module_file(self, fp: str) -> str:
+        if not self.py_module_path:
+            raise Exception(f"Module path not set, cannot read {fp}")
+        return read_file_cached(os.path.join(self.py_module_path, fp))
+
     def get_schema(self, schema_like: SchemaLike) -> Schema:
         if isinstance(schema_like, Schema):
             return schema_like
@@ -130,9 +188,8 @@ class SnapflowModule:
         if isinstance(schema_like, Schema):
             schema = schema_like
         elif isinstance(schema_like, str):
-            with self.open_module_file(schema_like) as f:
-                yml = f.read()
-                schema = schema_from_yaml(yml, module_name=self.name)
+            yml = self.read_module_file(schema_like)
+            schema = schema_from_yaml(yml, module_name=self.name)
         else:
             raise TypeError(schema_like)
         return schema
@@ -144,29 +201,22 @@ class SnapflowModule:
         return p
 
     def process_pipe(self, pipe_like: Union[PipeLike, str]) -> Pipe:
-        from snapflow.core.pipe import (
-            Pipe,
-            make_pipe,
-            Pipe,
-        )
-        from snapflow.core.sql.pipe import sql_pipe
+        Pipe, _, _ = _pipe_factories()
 
         if isinstance(pipe_like, Pipe):
             pipe = pipe_like
         else:
             if callable(pipe_like):
-                pipe = make_pipe(pipe_like, module=self.name)
+                pipe = make_pipe_cached(pipe_like, self.name)
             elif isinstance(pipe_like, str) and pipe_like.endswith(".sql"):
                 if not self.py_module_path:
                     raise Exception(
                         f"Module path not set, cannot read sql definition {pipe_like}"
                     )
-                sql_file_path = os.path.join(self.py_module_path, pipe_like)
-                with open(sql_file_path) as f:
-                    sql = f.read()
+                sql = self.read_module_file(pipe_like)
                 file_name = os.path.basename(pipe_like)[:-4]
-                pipe = sql_pipe(
-                    name=file_name, module=self.name, sql=sql
+                pipe = sql_pipe_cached(
+                    file_name, self.name, sql
                 )  # TODO: versions, runtimes, etc for sql (someway to specify in a .sql file)
             else:
                 raise TypeError(pipe_like)
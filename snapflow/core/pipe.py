@@ -1,18 +1,31 @@
 from __future__ import annotations
 
 import inspect
+import sys
 from dataclasses import asdict, dataclass, field
-from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union, cast
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
-from pandas import DataFrame
 from snapflow.core.data_block import DataBlock, DataBlockMetadata
 from snapflow.core.module import DEFAULT_LOCAL_MODULE, SnapflowModule
 from snapflow.core.pipe_interface import PipeAnnotation, PipeInterface
 from snapflow.core.runtime import DatabaseRuntimeClass, PythonRuntimeClass, RuntimeClass
 from snapflow.storage.data_formats import DatabaseTableRef, Records
+from snapflow.utils.common import add_slots
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
     from snapflow.core.execution import PipeContext
     from snapflow import Environment
 
@@ -28,7 +41,7 @@ class InputExhaustedException(PipeException):
 PipeCallable = Callable[..., Any]
 
 DataInterfaceType = Union[
-    DataFrame,
+    "DataFrame",
     Records,
     DatabaseTableRef,
     DataBlockMetadata,
@@ -36,16 +49,49 @@ DataInterfaceType = Union[
 ]  # TODO: also input...?   Isn't this duplicated with the Interface list AND with DataFormats?
 
 
+@lru_cache(maxsize=128)
+def _get_runtime_class(runtime: str) -> Type[RuntimeClass]:
+    rl = runtime.lower()
+    if any(tok in rl for tok in ("ql", "database", "postgre")):
+        return DatabaseRuntimeClass
+    return PythonRuntimeClass
+
+
 def get_runtime_class(runtime: Optional[str]) -> Type[RuntimeClass]:
     if runtime is None:
         return PythonRuntimeClass
-    if (
-        "ql" in runtime.lower()
-        or "database" in runtime.lower()
-        or "postgre" in runtime.lower()
-    ):
-        return DatabaseRuntimeClass
-    return PythonRuntimeClass
+    return _get_runtime_class(runtime)
+
+
+@lru_cache(maxsize=512)
+def _get_source_code(pipe_callable: Callable) -> str:
+    # Pipes are frozen, so source only needs to be found and tokenized once
+    return inspect.getsource(pipe_callable)
+
+
+@lru_cache(maxsize=512)
+def _get_pipe_definition_interface(pipe_callable: Callable) -> PipeInterface:
+    # Signature inspection is the expensive part of graph resolution, and
+    # interfaces are frozen, so do it once per callable
+    return PipeInterface.from_pipe_definition(pipe_callable)
+
+
+@lru_cache(maxsize=512)
+def _get_declared_interface(
+    declared_inputs: Optional[Tuple[Tuple[str, str], ...]],
+    declared_output: Optional[str],
+) -> PipeInterface:
+    inputs = []
+    if declared_inputs:
+        for name, annotation in declared_inputs:
+            inputs.append(PipeAnnotation.from_type_annotation(annotation, name=name))
+    output = None
+    if declared_output:
+        output = PipeAnnotation.from_type_annotation(declared_output)
+    return PipeInterface(
+        inputs=inputs,
+        output=output,
+    )
 
 
 def make_pipe_name(pipe: Union[PipeCallable, str]) -> str:
@@ -61,6 +107,7 @@ def make_pipe_name(pipe: Union[PipeCallable, str]) -> str:
     raise Exception(f"Invalid Pipe name {pipe}")
 
 
+@add_slots
 @dataclass(frozen=True)
 class Pipe:
     name: str
@@ -108,22 +155,17 @@ class Pipe:
     def _get_pipe_interface(self) -> PipeInterface:
         if hasattr(self.pipe_callable, "get_interface"):
             return self.pipe_callable.get_interface()  # type: ignore
-        return PipeInterface.from_pipe_definition(self.pipe_callable)
+        try:
+            return _get_pipe_definition_interface(self.pipe_callable)
+        except TypeError:
+            # Unhashable callable
+            return PipeInterface.from_pipe_definition(self.pipe_callable)
 
     def _get_declared_interface(self) -> PipeInterface:
-        inputs = []
+        declared_inputs = None
         if self.declared_inputs:
-            for name, annotation in self.declared_inputs.items():
-                inputs.append(
-                    PipeAnnotation.from_type_annotation(annotation, name=name)
-                )
-        output = None
-        if self.declared_output:
-            output = PipeAnnotation.from_type_annotation(self.declared_output)
-        return PipeInterface(
-            inputs=inputs,
-            output=output,
-        )
+            declared_inputs = tuple(self.declared_inputs.items())
+        return _get_declared_interface(declared_inputs, self.declared_output)
 
     def source_code_language(self) -> str:
         from snapflow.core.sql.pipe import SqlPipeWrapper
@@ -138,7 +180,11 @@ class Pipe:
         # TODO: more principled approach (can define a "get_source_code" otherwise we inspect?)
         if isinstance(self.pipe_callable, SqlPipeWrapper):
             return self.pipe_callable.sql
-        return inspect.getsource(self.pipe_callable)
+        try:
+            return _get_source_code(self.pipe_callable)
+        except TypeError:
+            # Unhashable callable
+            return inspect.getsource(self.pipe_callable)
 
 
 PipeLike = Union[PipeCallable, Pipe]
@@ -164,8 +210,9 @@ def pipe_factory(
     else:
         module_name = module
     return Pipe(
-        name=name,
-        module_name=module_name,
+        # Interned, names are compared and hashed constantly in library lookups
+        name=sys.intern(name),
+        module_name=sys.intern(module_name),
         pipe_callable=pipe_callable,
         compatible_runtime_classes=[runtime_class],
         declared_inputs=inputs,
@@ -181,6 +181,7 @@ def extract_types(
 class SqlPipeWrapper:
     def __init__(self, sql: str):
         self.sql = sql
+        self._interface: Optional[PipeInterface] = None
 
     def __call__(
         self, *args: PipeContext, **inputs: DataInterfaceType
@@ -258,8 +259,10 @@ class SqlPipeWrapper:
         return extract_types(self.sql, self.get_input_table_stmts(inputs))
 
     def get_interface(self) -> PipeInterface:
-        stmt = self.get_typed_statement()
-        return stmt.interface
+        # Sql is fixed, so only parse it for the interface once
+        if self._interface is None:
+            self._interface = self.get_typed_statement().interface
+        return self._interface
 
 
 def sql_pipe_factory(
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
 from dateutil.parser import ParserError
@@ -48,18 +49,34 @@ def dataframe_to_sqlalchemy_table():
     pass
 
 
+# Enough rows to stabilize column types, inference never walks the full data
+INFERENCE_SAMPLE_SIZE = 100
+
+
 def get_sample(
-    values: List[Any], sample_size: int = 100, method: str = "headtail"
+    values: Iterable[Any],
+    sample_size: int = INFERENCE_SAMPLE_SIZE,
+    method: str = "headtail",
 ) -> List[Any]:
     if method != "headtail":
         raise NotImplementedError
+    if not isinstance(values, Sequence):
+        # Sampling would silently consume a one-shot iterator
+        raise TypeError(f"Cannot sample {type(values)}, use `peek_sample` instead")
     if len(values) < sample_size:
-        sample = values
-    else:
-        half = sample_size // 2
-        sample = values[:half]
-        sample += values[-half:]
-    return sample
+        return values if isinstance(values, list) else list(values)
+    half = sample_size // 2
+    return list(values[:half]) + list(values[-half:])
+
+
+def peek_sample(
+    values: Iterable[Any], sample_size: int = INFERENCE_SAMPLE_SIZE
+) -> Tuple[List[Any], Iterator[Any]]:
+    # For one-shot iterators (eg streamed csv rows): sample the head, and hand back
+    # an iterator over every value with the sampled ones chained back in front
+    itr = iter(values)
+    sample = list(islice(itr, sample_size))
+    return sample, chain(sample, itr)
 
 
 # type_dominance = [
@@ -75,21 +92,22 @@ def get_sample(
 
 
 def infer_schema_fields_from_records(
-    records: Records, sample_size: int = 100
+    records: Records, sample_size: int = INFERENCE_SAMPLE_SIZE
 ) -> List[Field]:
     records = get_sample(records, sample_size=sample_size)
-    # df = pd.DataFrame(records)
-    d = records_as_dict_of_lists(records)
+    return infer_schema_fields_from_columns(
+        records_as_dict_of_lists(records), sample_size=sample_size
+    )
+
+
+def infer_schema_fields_from_columns(
+    columns: Dict[str, List[Any]], sample_size: int = INFERENCE_SAMPLE_SIZE
+) -> List[Field]:
     fields = []
-    for s in d:
-        # satype = pandas_series_to_sqlalchemy_type(df[s])
-        # objs = [r.get(s) for r in records]
-        satype2 = get_sqlalchemy_type_for_python_objects(d[s])
-        # if satype != satype2:
-        #     logger.warning(f"Differing for {s}", satype, satype2)
-        #     # satype2 = get_highest_precedence_sa_type([satype, satype2])
-        f = create_quick_field(s, satype2)
-        fields.append(f)
+    for name, values in columns.items():
+        values = get_sample(values, sample_size=sample_size)
+        satype = get_sqlalchemy_type_for_python_objects(values)
+        fields.append(create_quick_field(name, satype))
     return fields
 
 
@@ -98,6 +116,11 @@ def infer_schema_from_records(records: Records, **kwargs) -> Schema:
     return generate_auto_schema(fields, **kwargs)
 
 
+def infer_schema_from_columns(columns: Dict[str, List[Any]], **kwargs) -> Schema:
+    fields = infer_schema_fields_from_columns(columns)
+    return generate_auto_schema(fields, **kwargs)
+
+
 def generate_auto_schema(fields, **kwargs) -> Schema:
     auto_name = "AutoSchema_" + rand_str(8)
     args = dict(
@@ -360,34 +383,65 @@ def conform_records_to_schema(d: Records, schema: Schema) -> Records:
     return conformed
 
 
+def conform_series_to_field(s: Series, field: Field) -> Series:
+    pd_type = sqlalchemy_type_to_pandas_type(field.field_type)
+    if s.dtype.name == pd_type:
+        return s
+    # TODO: `astype` is not aggressive enough (won't cast values), so doesn't work
+    # Likely need combo of "hard" conversion using `to_*` methods and `infer_objects`
+    # and explicit individual python casts if that fails
+    if "datetime" in pd_type:
+        logger.debug("Casting {} to datetime", field.name)
+        return pd.to_datetime(s)
+    try:
+        s = s.astype(pd_type)
+        logger.debug("Casting {} to {}", field.name, pd_type)
+        return s
+    except (TypeError, ValueError, ParserError):
+        logger.debug(
+            "Manually casting {} to py objects {}",
+            field.name,
+            field.field_type,
+        )
+        return Series(
+            [cast_python_object_to_sqlalchemy_type(v, field.field_type) for v in s],
+            index=s.index,
+            name=s.name,
+        )
+
+
 def conform_dataframe_to_schema(df: DataFrame, schema: Schema) -> DataFrame:
-    logger.debug(f"conforming {df.head(5)} to schema {schema}")
+    # Lazy, so df.head() and its repr only run if debug logs are on
+    logger.opt(lazy=True).debug(
+        "conforming {} to schema {}", lambda: df.head(5), lambda: schema
+    )
     for field in schema.fields:
-        pd_type = sqlalchemy_type_to_pandas_type(field.field_type)
-        try:
-            if field.name in df:
-                if df[field.name].dtype.name == pd_type:
-                    continue
-                # TODO: `astype` is not aggressive enough (won't cast values), so doesn't work
-                # Likely need combo of "hard" conversion using `to_*` methods and `infer_objects`
-                # and explicit individual python casts if that fails
-                if "datetime" in pd_type:
-                    logger.debug(f"Casting {field.name} to datetime")
-                    df[field.name] = pd.to_datetime(df[field.name])
-                else:
-                    try:
-                        df[field.name] = df[field.name].astype(pd_type)
-                        logger.debug(f"Casting {field.name} to {pd_type}")
-                    except (TypeError, ValueError, ParserError):
-                        logger.debug(
-                            f"Manually casting {field.name} to py objects {field.field_type}"
-                        )
-                        df[field.name] = [
-                            cast_python_object_to_sqlalchemy_type(v, field.field_type)
-                            for v in df[field.name]
-                        ]
-            else:
-                df[field.name] = Series(dtype=pd_type)
-        except Exception as e:
-            raise e
+        if field.name in df:
+            s = df[field.name]
+            conformed = conform_series_to_field(s, field)
+            if conformed is not s:
+                df[field.name] = conformed
+        else:
+            df[field.name] = Series(
+                dtype=sqlalchemy_type_to_pandas_type(field.field_type)
+            )
+    return df
+
+
+def conform_columns_to_schema(columns: Dict[str, List], schema: Schema) -> DataFrame:
+    # Casts each column as its Series is built, then makes the frame once, so
+    # there's no intermediate object frame to re-cast column by column
+    fields = {f.name: f for f in schema.fields}
+    conformed = {}
+    for name, values in columns.items():
+        s = Series(values, name=name)
+        if name in fields:
+            s = conform_series_to_field(s, fields[name])
+        conformed[name] = s
+    df = DataFrame(conformed)
+    for field in schema.fields:
+        if field.name not in df:
+            df[field.name] = Series(
+                dtype=sqlalchemy_type_to_pandas_type(field.field_type)
+            )
     return df
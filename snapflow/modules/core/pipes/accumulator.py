@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Optional
 
 from loguru import logger
@@ -24,10 +25,14 @@ def dataframe_accumulator(
     input: Stream[T],
     this: Optional[DataBlock[T]] = None,
 ) -> DataFrame[T]:
-    accumulated_dfs = [block.as_dataframe() for block in input]
-    if this is not None:
-        accumulated_dfs = [this.as_dataframe()] + accumulated_dfs
-    return concat(accumulated_dfs)
+    blocks = input if this is None else chain([this], input)
+    # Collect frames as-is and fuse once, never growing an intermediate frame
+    accumulated_dfs = [block.as_dataframe() for block in blocks]
+    non_empty_dfs = [df for df in accumulated_dfs if len(df)] or accumulated_dfs[:1]
+    if len(non_empty_dfs) == 1:
+        # Nothing to combine (eg empty `this` on first run), skip the concat copy
+        return non_empty_dfs[0]
+    return concat(non_empty_dfs, copy=False, ignore_index=True)
 
 
 # TODO: this is no-op if "this" is empty... is there a way to shortcut?
@@ -94,16 +99,17 @@ def test_accumulator():
         (input_data_1, expected_1),
         (input_data_2, expected_2),
     ]:
+        data_input = DataInput(input_data, schema="CoreTestSchema", module=core)
+        expected_input = DataInput(expected, schema="CoreTestSchema", module=core)
         for p in [sql_accumulator, dataframe_accumulator]:
-            data_input = DataInput(input_data, schema="CoreTestSchema", module=core)
             with produce_pipe_output_for_static_input(
                 p, input=data_input, target_storage=s
             ) as db:
                 logger.debug(db)
                 logger.debug("TEST df conversion")
-                expected_df = DataInput(
-                    expected, schema="CoreTestSchema", module=core
-                ).as_dataframe(db.manager.ctx.env, db.manager.sess)
+                expected_df = expected_input.as_dataframe(
+                    db.manager.ctx.env, db.manager.sess
+                )
                 logger.debug("TEST df conversion 2")
                 df = db.as_dataframe()
                 assert_dataframes_are_almost_equal(
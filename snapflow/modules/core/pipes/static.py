@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 
-from pandas import DataFrame
 from snapflow.core.execution import PipeContext
 from snapflow.core.pipe import pipe
 from snapflow.schema.base import SchemaLike
@@ -13,6 +13,9 @@ from snapflow.storage.data_formats.delimited_file_object import (
 from snapflow.storage.data_records import MemoryDataRecords, as_records
 from snapflow.utils.data import read_csv
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 @dataclass
 class LocalExtractState:
@@ -21,8 +24,10 @@ class LocalExtractState:
 
 @dataclass
 class ExtractDataFrameConfig:
-    dataframe: DataFrame
+    dataframe: Optional[DataFrame]
     schema: SchemaLike
+    # Key from `Environment.register_dataframe`, keeps the frame out of logged config
+    dataframe_ref: Optional[str] = None
 
 
 @pipe(
@@ -38,7 +43,11 @@ def extract_dataframe(ctx: PipeContext) -> MemoryDataRecords:  # TODO optional
         return  # TODO: typing fix here?
     ctx.emit_state_value("extracted", True)
     schema = ctx.get_config_value("schema")
-    df = ctx.get_config_value("dataframe")
+    ref = ctx.get_config_value("dataframe_ref")
+    if ref is not None:
+        df = ctx.run_context.env.get_registered_dataframe(ref)
+    else:
+        df = ctx.get_config_value("dataframe")
     return as_records(df, data_format=DataFrameFormat, schema=schema)
 
 
@@ -60,7 +69,8 @@ def extract_csv(ctx: PipeContext) -> MemoryDataRecords:
         return
         # Static resource, if already emitted, return
     path = ctx.get_config_value("path")
-    f = open(path)
+    # Large buffer to cut read syscalls, newline="" as the csv module expects
+    f = open(path, newline="", buffering=8 << 20)
     ctx.emit_state_value("extracted", True)
     schema = ctx.get_config_value("schema")
     return as_records(f, data_format=DelimitedFileObjectFormat, schema=schema)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import strictyaml
@@ -234,9 +236,15 @@ def schema_like_to_name(d: SchemaLike) -> str:
     raise TypeError(d)
 
 
-def schema_from_yaml(yml: str, **overrides: Any) -> Schema:
+@lru_cache(maxsize=512)
+def _load_yaml(yml: str) -> Dict:
     # TODO: add strictyaml schema
-    d = strictyaml.load(yml).data
+    return strictyaml.load(yml).data
+
+
+def schema_from_yaml(yml: str, **overrides: Any) -> Schema:
+    # Parsed yaml is cached, so copy before cleaning (which mutates in place)
+    d = deepcopy(_load_yaml(yml))
     d = clean_raw_schema_defintion(d)
     return build_schema_from_dict(d, **overrides)
 
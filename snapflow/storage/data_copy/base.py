@@ -249,6 +249,7 @@ class CopyLookup:
         self.available_storage_formats = self._get_all_available_formats()
         self.expected_record_count = expected_record_count  # TODO: hmmmmm
         self._graph = self._build_copy_graph(expected_record_count)
+        self._path_cache: Dict[Conversion, Optional[ConversionPath]] = {}
 
     def _get_all_available_formats(self) -> List[StorageFormat]:
         fmts = []
@@ -279,6 +280,14 @@ class CopyLookup:
         return self._lookup.get(conversion, [])
 
     def get_lowest_cost_path(self, conversion: Conversion) -> Optional[ConversionPath]:
+        # Copy graph is fixed once built, so resolve each conversion only once
+        if conversion not in self._path_cache:
+            self._path_cache[conversion] = self._find_lowest_cost_path(conversion)
+        return self._path_cache[conversion]
+
+    def _find_lowest_cost_path(
+        self, conversion: Conversion
+    ) -> Optional[ConversionPath]:
         try:
             path = nx.shortest_path(
                 self._graph,
@@ -316,17 +325,34 @@ class CopyLookup:
                 print("\t", d, attrs["converter"])
 
 
+_datacopy_lookup_cache: Dict[Tuple, CopyLookup] = {}
+
+
 def get_datacopy_lookup(
     copiers: Iterable[DataCopier] = None,
     available_storage_engines: Set[Type[StorageEngine]] = None,
     available_data_formats: Iterable[DataFormat] = None,
     expected_record_count: int = 10000,
 ) -> CopyLookup:
-    return CopyLookup(
-        copiers=copiers or all_data_copiers,
-        available_storage_engines=available_storage_engines
-        or set(global_registry.all(StorageEngine)),
-        available_data_formats=available_data_formats
-        or list(global_registry.all(DataFormatBase)),
-        expected_record_count=expected_record_count,
-    )
+    engines = frozenset(available_storage_engines or global_registry.all(StorageEngine))
+    formats = tuple(available_data_formats or global_registry.all(DataFormatBase))
+    if copiers:
+        return CopyLookup(
+            copiers=copiers,
+            available_storage_engines=set(engines),
+            available_data_formats=list(formats),
+            expected_record_count=expected_record_count,
+        )
+    # Building the copy graph is expensive, and the registered copiers only ever grow,
+    # so cache lookups built from the global copiers (keyed on how many are registered)
+    key = (len(all_data_copiers), engines, formats, expected_record_count)
+    lookup = _datacopy_lookup_cache.get(key)
+    if lookup is None:
+        lookup = CopyLookup(
+            copiers=list(all_data_copiers),
+            available_storage_engines=set(engines),
+            available_data_formats=list(formats),
+            expected_record_count=expected_record_count,
+        )
+        _datacopy_lookup_cache[key] = lookup
+    return lookup
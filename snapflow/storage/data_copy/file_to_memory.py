@@ -55,7 +55,8 @@ def copy_delim_file_to_records(
     assert isinstance(from_storage_api, FileSystemStorageApi)
     assert isinstance(to_storage_api, PythonStorageApi)
     with from_storage_api.open(from_name) as f:
-        records = list(read_csv(f.readlines()))
+        # Parse straight off the file object, no intermediate list of lines
+        records = list(read_csv(f))
         mdr = as_records(records, data_format=RecordsFormat, schema=schema)
         mdr = mdr.conform_to_schema()
         to_storage_api.put(to_name, mdr)
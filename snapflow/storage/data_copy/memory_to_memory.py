@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Sequence
 
 import pandas as pd
@@ -43,7 +44,11 @@ from snapflow.utils.data import (
     with_header,
     write_csv,
 )
-from snapflow.utils.pandas import dataframe_to_records, records_to_dataframe
+from snapflow.utils.pandas import (
+    dataframe_to_records,
+    empty_dataframe_for_schema,
+    records_to_dataframe,
+)
 
 
 @datacopy(
@@ -160,9 +165,7 @@ def copy_records_iterator_to_records(
     assert isinstance(from_storage_api, PythonStorageApi)
     assert isinstance(to_storage_api, PythonStorageApi)
     mdr = from_storage_api.get(from_name)
-    all_records = []
-    for records in mdr.records_object:
-        all_records.extend(records)
+    all_records = list(chain.from_iterable(mdr.records_object))
     to_mdr = as_records(all_records, data_format=RecordsFormat, schema=schema)
     to_mdr = to_mdr.conform_to_schema()
     to_storage_api.put(to_name, to_mdr)
@@ -186,10 +189,66 @@ def copy_dataframe_iterator_to_dataframe(
     assert isinstance(from_storage_api, PythonStorageApi)
     assert isinstance(to_storage_api, PythonStorageApi)
     mdr = from_storage_api.get(from_name)
-    all_dfs = []
-    for df in mdr.records_object:
-        all_dfs.append(df)
-    to_mdr = as_records(pd.concat(all_dfs), data_format=DataFrameFormat, schema=schema)
+    df = pd.concat(list(mdr.records_object), copy=False, ignore_index=True)
+    to_mdr = as_records(df, data_format=DataFrameFormat, schema=schema)
+    to_mdr = to_mdr.conform_to_schema()
+    to_storage_api.put(to_name, to_mdr)
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[DataFrameIteratorFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[RecordsFormat],
+    cost=MemoryToMemoryCost,
+)
+def copy_dataframe_iterator_to_records(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    mdr = from_storage_api.get(from_name)
+    # Convert chunk by chunk, never materializing the concatenated dataframe
+    all_records = list(
+        chain.from_iterable(
+            dataframe_to_records(df, schema) for df in mdr.records_object
+        )
+    )
+    to_mdr = as_records(all_records, data_format=RecordsFormat, schema=schema)
+    to_mdr = to_mdr.conform_to_schema()
+    to_storage_api.put(to_name, to_mdr)
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[RecordsIteratorFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameFormat],
+    cost=MemoryToMemoryCost,
+)
+def copy_records_iterator_to_dataframe(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    mdr = from_storage_api.get(from_name)
+    # Build a frame per chunk rather than one giant intermediate records list
+    dfs = [records_to_dataframe(records, schema) for records in mdr.records_object]
+    if dfs:
+        df = pd.concat(dfs, copy=False, ignore_index=True)
+    else:
+        df = empty_dataframe_for_schema(schema)
+    to_mdr = as_records(df, data_format=DataFrameFormat, schema=schema)
     to_mdr = to_mdr.conform_to_schema()
     to_storage_api.put(to_name, to_mdr)
 
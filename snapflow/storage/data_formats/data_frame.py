@@ -28,7 +28,8 @@ class DataFrameFormat(MemoryDataFormatBase[DataFrame]):
 
     @classmethod
     def get_records_sample(cls, obj: Any, n: int = 200) -> Optional[List[Dict]]:
-        return obj.to_dict(orient="records")[:n]
+        # Only convert the rows we need, not the whole frame
+        return obj.head(n).to_dict(orient="records")
 
     @classmethod
     def definitely_instance(cls, obj: Any) -> bool:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import os
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Type
 
 import sqlalchemy
 from loguru import logger
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
 
 
 _sa_engines: List[Engine] = []
+_shared_sa_engines: Dict[str, Engine] = {}
 
 
 def dispose_all(keyword: Optional[str] = None):
@@ -42,6 +43,7 @@ class DatabaseApi:
         json_serializer: Callable = None,
     ):
         self.url = url
+        self.has_default_json_serializer = json_serializer is None
         self.json_serializer = (
             json_serializer
             if json_serializer is not None
@@ -52,14 +54,25 @@ class DatabaseApi:
     def get_engine(self) -> sqlalchemy.engine.Engine:
         if self.eng is not None:
             return self.eng
+        # A new api is created for every `Storage.get_api()`, share the engine (and
+        # its connection pool) across them rather than re-creating it every time
+        shareable = self.has_default_json_serializer and self.engine_is_shareable()
+        if shareable and self.url in _shared_sa_engines:
+            self.eng = _shared_sa_engines[self.url]
+            return self.eng
         self.eng = sqlalchemy.create_engine(
             self.url,
             json_serializer=self.json_serializer,
             echo=False,
         )
         _sa_engines.append(self.eng)
+        if shareable:
+            _shared_sa_engines[self.url] = self.eng
         return self.eng
 
+    def engine_is_shareable(self) -> bool:
+        return True
+
     def dialect_is_supported(self) -> bool:
         return True
 
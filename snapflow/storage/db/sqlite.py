@@ -9,6 +9,10 @@ from snapflow.utils.data import conform_records_for_insert
 
 
 class SqliteDatabaseApi(DatabaseApi):
+    def engine_is_shareable(self) -> bool:
+        # Every in-memory engine is its own database
+        return self.url not in ("sqlite://", "sqlite:///:memory:")
+
     @classmethod
     @contextmanager
     def temp_local_database(cls) -> Iterator[str]:
@@ -1,6 +1,7 @@
 import os
 import tempfile
 from collections.abc import Generator
+from functools import lru_cache
 from typing import Iterable, List
 
 import jinja2
@@ -43,6 +44,7 @@ def column_list(cols: List[str], commas_first: bool = True) -> str:
     return '"' + join_str.join(cols) + '"'
 
 
+@lru_cache(maxsize=None)
 def get_jinja_env():
     template_dir = os.path.join(os.path.dirname(__file__), "sql_templates")
     env = jinja2.Environment(
@@ -54,9 +56,14 @@ def get_jinja_env():
     return env
 
 
+@lru_cache(maxsize=256)
+def get_jinja_sql_template(sql: str) -> jinja2.Template:
+    # Parsing and compiling a template to python is the expensive step, do it once per sql
+    return get_jinja_env().from_string(sql)
+
+
 def compile_jinja_sql(sql, template_ctx):
-    env = get_jinja_env()
-    tmpl = env.from_string(sql)
+    tmpl = get_jinja_sql_template(sql)
     sql = tmpl.render(**template_ctx)
     return sql
 
@@ -1,26 +1,54 @@
 from __future__ import annotations
 
+import sys
 import tempfile
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from pandas import DataFrame
 from snapflow import DataBlock, Environment, Graph, Pipe, Storage
 from snapflow.core.module import SnapflowModule
 from snapflow.core.node import DataBlockLog, Node, PipeLog
-from snapflow.core.typing.inference import infer_schema_from_records
+from snapflow.core.typing.inference import (
+    infer_schema_from_columns,
+    infer_schema_from_records,
+)
 from snapflow.schema.base import Schema, SchemaLike
 from snapflow.storage.db.utils import get_tmp_sqlite_db_url
 from snapflow.utils.common import rand_str
-from snapflow.utils.data import read_csv, read_json, read_raw_string_csv
+from snapflow.utils.data import (
+    read_csv,
+    read_json_lines,
+    read_raw_string_csv,
+    records_as_dict_of_lists,
+)
 from snapflow.utils.pandas import records_to_dataframe
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 
 def display_pipe_log(sess: Session):
-    for dbl in sess.query(DataBlockLog).order_by(DataBlockLog.created_at):
-        print(f"{dbl.pipe_log.pipe_key:30} {dbl.data_block_id:4} {dbl.direction}")
+    # Load each log's PipeLog in the same query, not one lazy load per row
+    query = (
+        sess.query(DataBlockLog)
+        .options(joinedload(DataBlockLog.pipe_log))
+        .order_by(DataBlockLog.created_at)
+        .yield_per(1000)
+    )
+    lines = [
+        f"{dbl.pipe_log.pipe_key:30} {dbl.data_block_id:4} {dbl.direction}"
+        for dbl in query
+    ]
+    if lines:
+        print("\n".join(lines))
+
+
+@lru_cache(maxsize=128)
+def parse_raw_string_csv(test_data: str) -> Dict[str, Tuple]:
+    # Test fixtures are re-used across pipes and runs, only parse each once
+    columns = records_as_dict_of_lists(read_raw_string_csv(test_data))
+    return {name: tuple(values) for name, values in columns.items()}
 
 
 def str_as_dataframe(
@@ -29,24 +57,31 @@ def str_as_dataframe(
     nominal_schema: Optional[Schema] = None,
 ) -> DataFrame:
     # TODO: add conform_dataframe_to_schema option
-    if test_data.endswith(".csv"):
+    if test_data.endswith(".json"):
         if module is None:
             raise
         with module.open_module_file(test_data) as f:
-            raw_records = list(read_csv(f.readlines()))
-    elif test_data.endswith(".json"):
+            raw_records = read_json_lines(f)
+        if nominal_schema is None:
+            nominal_schema = infer_schema_from_records(raw_records)
+        return records_to_dataframe(raw_records, nominal_schema)
+    # Csv rows all share the header, so build columns directly rather than
+    # a dict per row (for inference and the DataFrame)
+    columns: Dict[str, List]
+    if test_data.endswith(".csv"):
         if module is None:
             raise
         with module.open_module_file(test_data) as f:
-            raw_records = [read_json(line) for line in f]
+            columns = records_as_dict_of_lists(read_csv(f))
     else:
         # Raw str csv
-        raw_records = read_raw_string_csv(test_data)
+        columns = {
+            name: list(values)
+            for name, values in parse_raw_string_csv(test_data).items()
+        }
     if nominal_schema is None:
-        auto_schema = infer_schema_from_records(raw_records)
-        nominal_schema = auto_schema
-    df = records_to_dataframe(raw_records, nominal_schema)
-    return df
+        nominal_schema = infer_schema_from_columns(columns)
+    return records_to_dataframe(columns, nominal_schema)
 
 
 @dataclass
@@ -54,11 +89,24 @@ class DataInput:
     data: str
     schema: Optional[SchemaLike] = None
     module: Optional[SnapflowModule] = None
+    # (env, schema) from the last lookup, inputs are often resolved repeatedly
+    _resolved_schema: Optional[Tuple[Environment, Schema]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if isinstance(self.schema, str):
+            self.schema = sys.intern(self.schema)
+
+    def get_schema(self, env: Environment, sess: Session) -> Optional[Schema]:
+        if not self.schema:
+            return None
+        if self._resolved_schema is None or self._resolved_schema[0] is not env:
+            self._resolved_schema = (env, env.get_schema(self.schema, sess))
+        return self._resolved_schema[1]
 
     def as_dataframe(self, env: Environment, sess: Session):
-        schema = None
-        if self.schema:
-            schema = env.get_schema(self.schema, sess)
+        schema = self.get_schema(env, sess)
         return str_as_dataframe(self.data, module=self.module, nominal_schema=schema)
 
     def get_schema_key(self) -> Optional[str]:
@@ -87,30 +135,41 @@ def produce_pipe_output_for_static_input(
         target_storage = env.add_storage(target_storage)
     with env.session_scope() as sess:
         g = Graph(env)
-        input_datas = input
         input_nodes: Dict[str, Node] = {}
-        pi = pipe.get_interface()
+        non_recursive = pipe.get_interface().get_non_recursive_inputs()
         if not isinstance(input, dict):
-            assert len(pi.get_non_recursive_inputs()) == 1
-            input_datas = {pi.get_non_recursive_inputs()[0].name: input}
-        for input in pi.inputs:
-            if input.is_self_ref:
-                continue
-            assert input.name is not None
-            input_data = input_datas[input.name]
-            if isinstance(input_data, str):
-                input_data = DataInput(data=input_data)
-            n = g.create_node(
-                key=f"_input_{input.name}",
-                pipe="core.extract_dataframe",
-                config={
-                    "dataframe": input_data.as_dataframe(env, sess),
-                    "schema": input_data.get_schema_key(),
-                },
+            assert len(non_recursive) == 1
+            input = {non_recursive[0].name: input}
+        # Coerce raw strs once, up front
+        input_datas = {
+            name: DataInput(data=d) if isinstance(d, str) else d
+            for name, d in input.items()
+        }
+        names = [a.name for a in non_recursive]
+        assert None not in names
+        # Serial on this thread: the session isn't thread safe, and fixture
+        # parsing is GIL-bound so a pool wouldn't overlap it anyway
+        dfs = {name: input_datas[name].as_dataframe(env, sess) for name in names}
+        refs = {name: env.register_dataframe(dfs[name]) for name in names}
+        try:
+            for name in names:
+                n = g.create_node(
+                    key=f"_input_{name}",
+                    pipe="core.extract_dataframe",
+                    config={
+                        "dataframe_ref": refs[name],
+                        "schema": input_datas[name].get_schema_key(),
+                    },
+                )
+                input_nodes[name] = n
+            test_node = g.create_node(
+                key=f"{pipe.name}", pipe=pipe, config=config, upstream=input_nodes
+            )
+            db = env.produce(
+                test_node, to_exhaustion=False, target_storage=target_storage
             )
-            input_nodes[input.name] = n
-        test_node = g.create_node(
-            key=f"{pipe.name}", pipe=pipe, config=config, upstream=input_nodes
-        )
-        db = env.produce(test_node, to_exhaustion=False, target_storage=target_storage)
-        yield db
+            yield db
+        finally:
+            # Envs are often reused across cases, don't keep the inputs alive
+            for ref in refs.values():
+                env.unregister_dataframe(ref)
@@ -7,11 +7,13 @@ import random
 import re
 import string
 import uuid
-from dataclasses import field
+from dataclasses import field, fields
 from datetime import date, datetime, time, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     Iterable,
@@ -42,22 +44,49 @@ class StringEnum(Enum):
         return self.value
 
 
+def _slots_getstate(self) -> List[Any]:
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _slots_setstate(self, state: List[Any]):
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    """
+    Rebuild a dataclass with `__slots__` for its fields (`slots=True` is py3.10+)
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults are already captured by the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    if cls.__dataclass_params__.frozen:  # type: ignore
+        # Default pickling sets slots with setattr, which frozen classes refuse
+        cls_dict["__getstate__"] = _slots_getstate
+        cls_dict["__setstate__"] = _slots_setstate
+    metaclass: Any = cls.__class__
+    return metaclass(cls.__name__, cls.__bases__, cls_dict)
+
+
+TITLE_CASE_BOUNDARY_RE = re.compile(r"([a-z])([A-Z])")
+
+
+# Called per field / column name, which are a small recurring set
+@lru_cache(maxsize=4096)
 def title_to_snake_case(s: str) -> str:
-    return re.sub(r"([a-z])([A-Z])", r"\1_\2", s).lower()
+    return TITLE_CASE_BOUNDARY_RE.sub(r"\1_\2", s).lower()
 
 
+@lru_cache(maxsize=4096)
 def snake_to_title_case(s: str) -> str:
-    s2 = ""
-    title = True
-    for c in s:
-        if c == "_":
-            title = True
-            continue
-        if title:
-            c = c.upper()
-            title = False
-        s2 += c
-    return s2
+    if "_" not in s:
+        return s[:1].upper() + s[1:]
+    return "".join(p[:1].upper() + p[1:] for p in s.split("_"))
 
 
 def as_identifier(s: str) -> str:
@@ -244,6 +273,9 @@ def as_aware_datetime(v: Union[datetime, str, int]) -> datetime:
     return v
 
 
+DIGIT_RE = re.compile(r"\d")
+
+
 def is_datetime_str(s: str) -> bool:
     """
     Relatively conservative datetime string detector. Takes preference
@@ -251,6 +283,9 @@ def is_datetime_str(s: str) -> bool:
     """
     if not isinstance(s, str):
         s = str(s)
+    if DIGIT_RE.search(s) is None:
+        # A parsed date must have a (numeric) year, skip dateutil without one
+        return False
     try:
         int(s)
         return False
@@ -304,25 +339,47 @@ class JSONEncoder(json.JSONEncoder):
             return super().default(o)
 
 
+def _encode_datetime(o: datetime) -> str:
+    # See "Date Time String Format" in the ECMA-262 specification.
+    r = o.isoformat()
+    if o.microsecond:
+        r = r[:23] + r[26:]
+    if r.endswith("+00:00"):
+        r = r[:-6] + "Z"
+    return r
+
+
+def _encode_time(o: time) -> str:
+    if is_aware(o):
+        raise ValueError("JSON can't represent timezone-aware times.")
+    r = o.isoformat()
+    if o.microsecond:
+        r = r[:12]
+    return r
+
+
 class SnapflowJSONEncoder(json.JSONEncoder):
+    # Exact type -> encoder, one lookup per value for the common types.
+    # Subclasses (pandas Timestamp, enums etc) take the isinstance chain.
+    _encoders: Dict[type, Callable[[Any], str]] = {
+        datetime: _encode_datetime,
+        date: date.isoformat,
+        time: _encode_time,
+        timedelta: duration_iso_string,
+        decimal.Decimal: str,
+        uuid.UUID: str,
+    }
+
     def default(self, o: Any) -> str:
-        # See "Date Time String Format" in the ECMA-262 specification.
+        encoder = self._encoders.get(type(o))
+        if encoder is not None:
+            return encoder(o)
         if isinstance(o, datetime):
-            r = o.isoformat()
-            if o.microsecond:
-                r = r[:23] + r[26:]
-            if r.endswith("+00:00"):
-                r = r[:-6] + "Z"
-            return r
+            return _encode_datetime(o)
         elif isinstance(o, date):
             return o.isoformat()
         elif isinstance(o, time):
-            if is_aware(o):
-                raise ValueError("JSON can't represent timezone-aware times.")
-            r = o.isoformat()
-            if o.microsecond:
-                r = r[:12]
-            return r
+            return _encode_time(o)
         elif isinstance(o, timedelta):
             return duration_iso_string(o)
         elif isinstance(o, (decimal.Decimal, uuid.UUID)):
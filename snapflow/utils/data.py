@@ -4,7 +4,7 @@ import csv
 import json
 import typing
 from datetime import datetime
-from io import IOBase
+from io import IOBase, TextIOBase
 from itertools import tee
 from typing import (
     IO,
@@ -31,24 +31,40 @@ if TYPE_CHECKING:
     from snapflow.storage.data_formats import Records
 
 
-def records_as_dict_of_lists(dl: List[Dict]) -> Dict[str, List]:
+def records_as_dict_of_lists(dl: Iterable[Dict]) -> Dict[str, List]:
+    # Keys missing from a record are filled with None so all lists stay aligned
     series: Dict[str, List] = {}
+    n = 0
     for r in dl:
         for k, v in r.items():
-            if k in series:
-                series[k].append(v)
-            else:
-                series[k] = [v]
+            s = series.get(k)
+            if s is None:
+                s = series[k] = [None] * n
+            elif len(s) < n:
+                s.extend([None] * (n - len(s)))
+            s.append(v)
+        n += 1
+    for s in series.values():
+        if len(s) < n:
+            s.extend([None] * (n - len(s)))
     return series
 
 
-def is_nullish(o: Any, null_strings=["None", "null", "na", ""]) -> bool:
+NULL_STRINGS = frozenset(["None", "null", "na", ""])
+
+
+def is_nullish(o: Any, null_strings=NULL_STRINGS) -> bool:
     # TOOD: is "na" too aggressive?
+    # Called per value in inference / csv parsing, so cheap exact type checks go
+    # first and the (slow) abc Iterable and pandas checks last
     if o is None:
         return True
     if isinstance(o, str):
-        if o.lower() in null_strings:
-            return True
+        return o.lower() in null_strings
+    if isinstance(o, (int, list, dict)):
+        return False
+    if isinstance(o, float):
+        return o != o  # NaN
     if isinstance(o, Iterable):
         # No basic python object is "nullish", even if empty
         return False
@@ -73,11 +89,12 @@ def process_csv_value(v: Any) -> Any:
     return v
 
 
-def ensure_strings(i: Iterator[AnyStr]) -> Iterator[str]:
+def ensure_strings(i: Iterable[Union[str, bytes]]) -> Iterator[str]:
     for s in i:
         if isinstance(s, bytes):
-            s = s.decode("utf8")
-        yield s
+            yield s.decode("utf8")
+        else:
+            yield s
 
 
 def iterate_chunks(iterator: Iterator[T], chunk_size: int) -> Iterator[List[T]]:
@@ -109,14 +126,23 @@ def with_header(iterator: Iterator[Iterable[T]]) -> Iterator[Iterable[T]]:
 
 
 def read_csv(lines: Iterable[AnyStr], dialect=SnapflowCsvDialect) -> Iterator[Dict]:
-    lines = ensure_strings(lines)
-    reader = csv.reader(lines, dialect=dialect)
+    str_lines: Iterable[str]
+    if isinstance(lines, TextIOBase):
+        # Text files already yield str, let the reader iterate them directly
+        str_lines = lines
+    else:
+        str_lines = ensure_strings(lines)
+    reader = csv.reader(str_lines, dialect=dialect)
     try:
         headers = next(reader)
     except StopIteration:
         return
+    # Same as `is_nullish` for str values (all the csv module ever produces)
+    null_strings = NULL_STRINGS
     for line in reader:
-        yield {h: process_csv_value(v) for h, v in zip(headers, line)}
+        yield {
+            h: None if v.lower() in null_strings else v for h, v in zip(headers, line)
+        }
 
 
 def read_raw_string_csv(csv_str: str, **kwargs) -> Iterator[Dict]:
@@ -160,6 +186,27 @@ def read_json(j: str) -> Union[Dict, List]:
     return json.loads(j)  # TODO: de-serializer
 
 
+def read_json_lines(lines: Iterable[Union[str, bytes]]) -> List:
+    # Decode all lines (ndjson) with one json.loads call rather than one per line
+    str_lines = list(ensure_strings(lines))
+    non_blank = [ln for ln in str_lines if ln.strip()]
+    try:
+        objs = read_json("[" + ",".join(non_blank) + "]")
+        # A line like `1, 2` still decodes here, as several values
+        if isinstance(objs, list) and len(objs) == len(non_blank):
+            return objs
+    except json.JSONDecodeError:
+        pass
+    # Slow path, only to report which line is malformed
+    for i, ln in enumerate(str_lines, start=1):
+        try:
+            if ln.strip():
+                json.loads(ln)
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"Line {i}: {e.msg}", e.doc, e.pos) from e
+    raise json.JSONDecodeError("Malformed JSON lines", "", 0)
+
+
 def conform_records_for_insert(
     records: Records,
     columns: List[str],
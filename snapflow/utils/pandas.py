@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
-import pandas as pd
 from pandas import DataFrame, Index, Series
 from pandas._testing import assert_almost_equal
 from snapflow.schema.base import Schema
@@ -44,24 +43,35 @@ def assert_dataframes_are_almost_equal(
 def empty_dataframe_for_schema(schema: Schema) -> DataFrame:
     from snapflow.core.typing.inference import sqlalchemy_type_to_pandas_type
 
-    df = DataFrame()
-    for field in schema.fields:
-        pd_type = sqlalchemy_type_to_pandas_type(field.field_type)
-        df[field.name] = Series(dtype=pd_type)
-    return df
+    # Build all columns in one constructor, not an insert (and block) per field
+    return DataFrame(
+        {
+            field.name: Series(dtype=sqlalchemy_type_to_pandas_type(field.field_type))
+            for field in schema.fields
+        }
+    )
 
 
-def records_to_dataframe(records: Records, schema: Schema) -> DataFrame:
-    from snapflow.core.typing.inference import conform_dataframe_to_schema
+def records_to_dataframe(
+    records: Union[Records, Dict[str, List]], schema: Schema
+) -> DataFrame:
+    from snapflow.core.typing.inference import (
+        conform_columns_to_schema,
+        conform_dataframe_to_schema,
+    )
 
+    if isinstance(records, dict):
+        # Already columnar, conform while building the frame
+        return conform_columns_to_schema(records, schema)
     df = DataFrame(records)
     return conform_dataframe_to_schema(df, schema)
 
 
 def dataframe_to_records(df: DataFrame, schema: Schema = None) -> Records:
     # TODO
-    for c in df:
-        dfc = df[c].astype(object)
-        dfc.loc[pd.isna(dfc)] = None
-        df[c] = dfc
-    return df.to_dict(orient="records")
+    # One object-dtype pass converts numpy scalars to python ones and nulls
+    # (NaN / NaT / NA) to None, without mutating the caller's frame
+    # (`to_numpy(na_value=)` would be simpler, but needs pandas >= 1.1)
+    columns = df.columns.tolist()
+    values = df.astype(object).where(df.notna(), None).to_numpy()
+    return [dict(zip(columns, row)) for row in values]
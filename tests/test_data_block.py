@@ -49,4 +49,8 @@ def test_data_block_methods():
         assert db.nominal_schema(env, sess) == TestSchema2
         assert db.realized_schema(env, sess) == TestSchema3
         db.compute_record_count()
-        assert db.record_count == 1
\ No newline at end of file
+        assert db.record_count == 1
+        d = db._asdict()
+        assert list(d) == list(DataBlockMetadata.__mapper__.c.keys())
+        assert d["id"] == db.id
+        assert d["record_count"] == 1
@@ -118,6 +118,20 @@ def test_data_copy_lookup():
             ),
             1,
         ),
+        (
+            (
+                StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
+                StorageFormat(LocalPythonStorageEngine, RecordsFormat),
+            ),
+            1,
+        ),
+        (
+            (
+                StorageFormat(LocalPythonStorageEngine, RecordsIteratorFormat),
+                StorageFormat(LocalPythonStorageEngine, DataFrameFormat),
+            ),
+            1,
+        ),
         (
             (
                 StorageFormat(LocalPythonStorageEngine, RecordsIteratorFormat),
@@ -157,3 +171,18 @@ def test_conversion_costs(conversion: Conversion, length: Optional[int]):
         # for c in cp.conversions:
         #     print(f"{c.copier.copier_function} {c.conversion}")
         assert len(cp.conversions) == length
+
+
+def test_data_copy_lookup_is_cached():
+    assert get_datacopy_lookup() is get_datacopy_lookup()
+    engines = {LocalPythonStorageEngine, SqliteStorageEngine}
+    lkup = get_datacopy_lookup(available_storage_engines=engines)
+    assert lkup is get_datacopy_lookup(available_storage_engines=engines)
+    assert lkup is not get_datacopy_lookup()
+    conversion = Conversion(
+        StorageFormat(LocalPythonStorageEngine, RecordsFormat),
+        StorageFormat(SqliteStorageEngine, DatabaseTableFormat),
+    )
+    assert lkup.get_lowest_cost_path(conversion) is lkup.get_lowest_cost_path(
+        conversion
+    )
@@ -20,6 +20,10 @@ from snapflow.storage.data_copy.base import (
 )
 from snapflow.storage.data_copy.database_to_memory import copy_db_to_records
 from snapflow.storage.data_copy.memory_to_database import copy_records_to_db
+from snapflow.storage.data_copy.memory_to_memory import (
+    copy_records_iterator_to_dataframe,
+    copy_records_to_df,
+)
 from snapflow.storage.data_formats import (
     DatabaseCursorFormat,
     DatabaseTableFormat,
@@ -98,3 +102,32 @@ def test_record_count():
     for fmt, obj in [rf, dff]:
         cnt = fmt.get_record_count(obj())
         assert cnt == 2
+
+
+@pytest.mark.parametrize(
+    "records_",
+    [
+        [{"f1": "hi", "f2": 1}, {"f1": "bye", "f2": None}],
+        # As parsed from csv
+        [{"f1": "hi", "f2": "1"}, {"f1": "bye", "f2": "2"}],
+    ],
+)
+@pytest.mark.parametrize("chunked", [True, False])
+def test_records_iterator_to_dataframe_conforms(records_: List, chunked: bool):
+    chunks = [records_[:1], records_[1:]] if chunked else []
+    mem_api: PythonStorageApi = new_local_python_storage().get_api()
+    mem_api.put("_from", as_records(records_, data_format=RecordsFormat))
+    copy_records_to_df.copy(
+        "_from", "_expected", None, mem_api, mem_api, schema=TestSchema4
+    )
+    expected = mem_api.get("_expected").records_object
+    mem_api.put(
+        "_from_itr", as_records(iter(chunks), data_format=RecordsIteratorFormat)
+    )
+    copy_records_iterator_to_dataframe.copy(
+        "_from_itr", "_to", None, mem_api, mem_api, schema=TestSchema4
+    )
+    df = mem_api.get("_to").records_object
+    # Same dtypes as the plain Records path, even with no chunks at all
+    assert df.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert len(df) == (len(records_) if chunked else 0)
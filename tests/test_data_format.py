@@ -91,3 +91,8 @@ def test_not_maybe_is_instance():
     for obj, formats in maybe_instances:
         for fmt in formats:
             assert not fmt.maybe_instance(obj)
+
+
+def test_dataframe_records_sample():
+    assert DataFrameFormat.get_records_sample(df, n=3) == [{"a": 0}, {"a": 1}, {"a": 2}]
+    assert len(DataFrameFormat.get_records_sample(df)) == 10
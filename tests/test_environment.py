@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
+from loguru import logger
 from snapflow.core.environment import Environment
 from snapflow.core.graph import Graph
+from snapflow.storage.db.utils import get_tmp_sqlite_db_url
 
 
 def test_env_init():
@@ -22,3 +27,76 @@ def test_env_init():
         env.add_storage("postgresql://test")
         assert len(env.storages) == 2  # added plus default local memory
         assert len(env.runtimes) == 3  # added plus default local python # TODO
+
+
+def test_sqlite_metadata_pragmas():
+    env = Environment(metadata_storage=get_tmp_sqlite_db_url(), initial_modules=[])
+    with env.session_scope() as sess:
+        assert sess.execute("PRAGMA journal_mode").scalar() == "wal"
+        assert sess.execute("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert sess.execute("PRAGMA auto_vacuum").scalar() == 2  # INCREMENTAL
+    env.checkpoint_metadata()
+    # Nothing to checkpoint for in-memory dbs
+    Environment(metadata_storage="sqlite://", initial_modules=[]).checkpoint_metadata()
+
+
+def test_validate_and_clean_data_blocks():
+    from snapflow.core.data_block import DataBlockMetadata, StoredDataBlockMetadata
+    from snapflow.storage.data_formats import RecordsFormat
+
+    env = Environment(metadata_storage=get_tmp_sqlite_db_url(), initial_modules=[])
+    with env.session_scope() as sess:
+        block = DataBlockMetadata(realized_schema_key="Any")
+        sess.add(block)
+        sess.add(
+            StoredDataBlockMetadata(
+                data_block=block, storage_url="python://abc/", data_format=RecordsFormat
+            )
+        )
+    assert env.validate_and_clean_data_blocks(dry_run=True) == {
+        "memory_stored_data_blocks": 1,
+        "orphaned_data_blocks": 0,
+    }
+    messages = []
+    sink = logger.add(messages.append, level="DEBUG")
+    logger.enable("snapflow")
+    try:
+        env.validate_and_clean_data_blocks()
+    finally:
+        logger.disable("snapflow")
+        logger.remove(sink)
+    with env.session_scope() as sess:
+        assert sess.query(StoredDataBlockMetadata).count() == 0
+        assert sess.query(DataBlockMetadata).count() == 1
+        block_id = sess.query(DataBlockMetadata.id).scalar()
+    assert any(block_id in m and "Orphaned" in m for m in messages)
+    assert env.validate_and_clean_data_blocks(dry_run=True) == {
+        "memory_stored_data_blocks": 0,
+        "orphaned_data_blocks": 1,
+    }
+
+
+def test_env_without_core_module_registers_metadata_models():
+    # Fresh interpreter, so no other test has already imported the ORM models
+    code = """
+from snapflow.core.environment import Environment
+env = Environment(metadata_storage="sqlite://", initial_modules=[])
+from snapflow.core.data_block import DataBlockMetadata
+with env.session_scope() as sess:
+    assert sess.query(DataBlockMetadata).count() == 0
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_validate_and_clean_data_blocks_in_memory_db():
+    # In-memory engines aren't shared, so this must use the env's own sessions
+    env = Environment(metadata_storage="sqlite://", initial_modules=[])
+    assert env.validate_and_clean_data_blocks(dry_run=True) == {
+        "memory_stored_data_blocks": 0,
+        "orphaned_data_blocks": 0,
+    }
+    logger.enable("snapflow")
+    try:
+        env.validate_and_clean_data_blocks()
+    finally:
+        logger.disable("snapflow")
@@ -29,6 +29,21 @@ def test_example():
     assert_almost_equal(output.as_dataframe(), df)
 
 
+def test_example_dataframe_ref():
+    env = Environment(metadata_storage="sqlite://")
+    g = Graph(env)
+    env.add_module(core)
+    df = pd.DataFrame({"a": range(10), "b": range(10)})
+    ref = env.register_dataframe(df)
+    assert env.get_registered_dataframe(ref) is df
+    g.create_node(key="n1", pipe="extract_dataframe", config={"dataframe_ref": ref})
+    output = env.produce("n1", g)
+    assert_almost_equal(output.as_dataframe(), df)
+    env.unregister_dataframe(ref)
+    with pytest.raises(KeyError):
+        env.get_registered_dataframe(ref)
+
+
 Customer = create_quick_schema(
     "Customer", [("name", "Unicode"), ("joined", "DateTime"), ("metadata", "JSON")]
 )
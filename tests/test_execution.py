@@ -13,6 +13,7 @@ from snapflow.core.execution import (
     Worker,
 )
 from snapflow.core.graph import Graph
+from snapflow.core.node import DataBlockLog, PipeLog
 from snapflow.core.pipe_interface import NodeInterfaceManager
 from snapflow.modules import core
 from snapflow.storage.data_formats import Records
@@ -105,3 +106,18 @@ def test_non_terminating_pipe():
     em = ExecutionManager(ec)
     output = em.execute(node, to_exhaustion=True)
     assert output is None
+
+
+@pytest.mark.parametrize("commit_each_node", [False, True])
+def test_run_graph_node_failure(commit_each_node: bool):
+    env = make_test_env()
+    g = Graph(env)
+    g.create_node(key="source", pipe=pipe_dl_source)
+    g.create_node(key="error", pipe=pipe_error)
+    with pytest.raises(Exception, match="pipe FAIL"):
+        env.run_graph(g, commit_each_node=commit_each_node)
+    with env.session_scope() as sess:
+        # Completed nodes are kept either way
+        pipe_logs = sess.query(PipeLog).all()
+        assert [pl.node_key for pl in pipe_logs] == ["source"]
+        assert sess.query(DataBlockLog).count() == 1
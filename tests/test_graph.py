@@ -92,3 +92,16 @@ def test_make_graph():
     for ordering in expected_orderings:
         for i, n in enumerate(ordering[:-1]):
             assert execution_order.index(n) < execution_order.index(ordering[i + 1])
+
+
+def test_graph_structure_cached():
+    g = make_graph()
+    nx_graph = g.as_nx_graph()
+    assert g.as_nx_graph() is nx_graph
+    assert g.adjacency_list() is g.adjacency_list()
+    g.node(key="node8", pipe=pipe_t1_to_t2, upstream="node1")
+    assert g.as_nx_graph() is not nx_graph
+    assert "node8" in g.as_nx_graph()
+    assert len(g.get_all_nodes_in_execution_order()) == 8
+    g.remove_node(g.get_node("node8"))
+    assert len(g.get_all_nodes_in_execution_order()) == 7
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import gc
 import logging
+import os
+import weakref
 
 from loguru import logger
 from snapflow.core.module import SnapflowModule
 from snapflow.modules import core
+from snapflow.schema.base import create_quick_schema
 
 
 def test_module_init():
@@ -13,6 +17,40 @@ def test_module_init():
     assert isinstance(_test_module, SnapflowModule)
     assert len(_test_module.schemas) >= 1
     assert len(_test_module.pipes) >= 2
+    assert _test_module.pipes is _test_module.pipes
+
+
+def test_read_module_file(tmp_path):
+    fp = tmp_path / "schema.yml"
+    fp.write_text("name: A")
+    m = SnapflowModule("_tmp_module", py_module_path=str(tmp_path / "__init__.py"))
+    assert m.read_module_file("schema.yml") == "name: A"
+    fp.write_text("name: B")
+    st = os.stat(fp)
+    os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+    assert m.read_module_file("schema.yml") == "name: B"
+
+
+def test_module_views_refresh():
+    m = SnapflowModule("_tmp_module")
+    assert len(m.schemas) == 0
+    m.add_schema(create_quick_schema("S1", [("f1", "Unicode")], module_name=m.name))
+    assert m.schemas.S1.name == "S1"
+
+
+def test_process_pipe_is_cached():
+    def p1(ctx):
+        pass
+
+    m1 = SnapflowModule("_tmp_module1")
+    m2 = SnapflowModule("_tmp_module2")
+    assert m1.process_pipe(p1) is m1.process_pipe(p1)
+    assert m2.process_pipe(p1).module_name == "_tmp_module2"
+    # The cache doesn't keep the callable (or its pipes) alive
+    ref = weakref.ref(p1)
+    del p1
+    gc.collect()
+    assert ref() is None
 
 
 def test_core_module():
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, replace
 from typing import Callable
 
 import pytest
@@ -9,18 +12,21 @@ from snapflow.core.execution import PipeContext
 from snapflow.core.graph import Graph, graph
 from snapflow.core.module import DEFAULT_LOCAL_MODULE_NAME
 from snapflow.core.node import DeclaredNode, node
-from snapflow.core.pipe import Pipe, PipeInterface, PipeLike, pipe
+from snapflow.core.pipe import Pipe, PipeInterface, PipeLike, get_runtime_class, pipe
 from snapflow.core.pipe_interface import (
     NodeInterfaceManager,
     PipeAnnotation,
     get_schema_translation,
     make_default_output_annotation,
 )
+from snapflow.core.runtime import DatabaseRuntimeClass, PythonRuntimeClass
 from snapflow.core.streams import StreamBuilder, block_as_stream
 from snapflow.modules import core
+from snapflow.testing.utils import produce_pipe_output_for_static_input
 from snapflow.utils.typing import T, U
 from tests.utils import (
     TestSchema1,
+    TestSchema2,
     make_test_env,
     make_test_run_context,
     pipe_chain_t1_to_t2,
@@ -277,6 +283,18 @@ def test_pipe_interface(pipe: PipeLike, expected: PipeInterface):
     assert node.get_interface() == expected
 
 
+def test_pipe_interface_cached():
+    @pipe
+    def pipe_cached(input: DataBlock[TestSchema1]) -> DataFrame[TestSchema2]:
+        pass
+
+    assert pipe_cached._get_pipe_interface() is pipe_cached._get_pipe_interface()
+    assert (
+        pipe_cached._get_declared_interface() is pipe_cached._get_declared_interface()
+    )
+    assert pipe_cached.get_interface() == pipe_cached.get_interface()
+
+
 def test_generic_schema_resolution():
     ec = make_test_run_context()
     env = ec.env
@@ -400,6 +418,8 @@ def test_python_pipe():
 
     pi = p.get_interface()
     assert pi is not None
+    assert p.get_source_code().startswith("def pipe_t1_sink")
+    assert p.get_source_code() is p.get_source_code()
 
 
 @pipe("k1", compatible_runtimes="python")
@@ -412,6 +432,13 @@ def df2():
     pass
 
 
+def test_runtime_class():
+    assert df1.compatible_runtime_classes == [PythonRuntimeClass]
+    assert df2.compatible_runtime_classes == [DatabaseRuntimeClass]
+    assert get_runtime_class(None) is PythonRuntimeClass
+    assert get_runtime_class("PostgreSQL") is DatabaseRuntimeClass
+
+
 def test_node_no_inputs():
     env = make_test_env()
     g = Graph(env)
@@ -469,3 +496,26 @@ def test_any_schema_interface():
     pi = df.get_interface()
     assert pi.inputs[0].schema_like == "Any"
     assert pi.output.schema_like == "Any"
+
+
+def test_pipe_slots():
+    p = pipe(pipe_t1_source)
+    assert not hasattr(p, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        p.name = "other"  # type: ignore
+    assert copy.deepcopy(p) == p
+    assert pickle.loads(pickle.dumps(p)) == p
+    assert replace(p, name="other").name == "other"
+
+
+def test_static_input_multiple_inputs():
+    @pipe
+    def pipe_join(input: DataBlock, other: DataBlock) -> DataFrame:
+        return input.as_dataframe().merge(other.as_dataframe(), on="a")
+
+    with produce_pipe_output_for_static_input(
+        pipe_join, input={"input": "a,b\n1,2\n3,4", "other": "a,c\n1,x\n3,y"}
+    ) as db:
+        df = db.as_dataframe()
+        assert list(df.columns) == ["a", "b", "c"]
+        assert len(df) == 2
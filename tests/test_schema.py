@@ -11,8 +11,10 @@ from snapflow.core.module import DEFAULT_LOCAL_MODULE_NAME
 from snapflow.core.pipe_interface import get_schema_translation
 from snapflow.core.typing.inference import (
     cast_python_object_to_sqlalchemy_type,
+    get_sample,
     infer_schema_fields_from_records,
     infer_schema_from_records,
+    peek_sample,
 )
 from snapflow.modules import core
 from snapflow.schema.base import (
@@ -83,6 +85,11 @@ def test_schema_yaml():
     assert len(tt.implementations) == 1
     assert tt.implementations[0].schema_key == "SubType"
     assert tt.implementations[0].fields == {"sub_uniq": "uniq"}
+    # Parse is cached, but each call builds an independent Schema
+    tt2 = schema_from_yaml(test_schema_yml, module_name="m1")
+    assert tt2.key == "m1.TestSchema"
+    assert len(tt2.fields) == 2
+    assert tt2.fields is not tt.fields
 
 
 def test_schema_translation():
@@ -118,6 +125,23 @@ def test_schema_inference():
     assert field_types["g"] == "BigInteger"
     assert field_types["h"] == DEFAULT_UNICODE_TEXT_TYPE
     assert field_types["i"] == DEFAULT_UNICODE_TYPE
+    # Streamed records infer the same from the head, and lose no rows
+    sample, itr = peek_sample(iter(sample_records), sample_size=4)
+    assert infer_schema_fields_from_records(sample) == fields
+    assert list(itr) == list(sample_records)
+    with pytest.raises(TypeError):
+        get_sample(iter(sample_records))
+    # Any sequence gets the head and tail
+    assert get_sample(tuple(range(10)), sample_size=4) == [0, 1, 8, 9]
+
+
+def test_schema_inference_is_sampled():
+    # Only the head and tail are sampled, middle rows never affect inference
+    records = [{"a": i} for i in range(1000)]
+    for r in records[100:900]:
+        r["a"] = "not an int"
+    fields = infer_schema_fields_from_records(records)
+    assert fields[0].field_type == "BigInteger"
 
 
 def test_generated_schema():
@@ -135,6 +159,14 @@ def test_generated_schema():
         assert asdict(got_schema) == asdict(new_schema)
         assert env.get_generated_schema(new_schema.key, sess).key == new_schema.key
         assert env.get_generated_schema("pizza", sess) is None
+        assert env.get_schema(new_schema.key, sess).key == new_schema.key
+        assert new_schema.key in env.library.schemas
+        with pytest.raises(KeyError):
+            env.get_schema("pizza", sess)
+        assert "pizza" in env._missing_schema_keys
+        pizza = create_quick_schema("pizza", [("f1", "Unicode")])
+        env.add_new_generated_schema(pizza, sess)
+        assert env.get_schema("pizza", sess) is pizza
 
 
 def test_any_schema():
@@ -9,6 +9,7 @@ from snapflow.storage.data_records import MemoryDataRecords, as_records
 from snapflow.storage.db.api import DatabaseApi, DatabaseStorageApi
 from snapflow.storage.db.mysql import MysqlDatabaseStorageApi
 from snapflow.storage.db.postgres import PostgresDatabaseStorageApi
+from snapflow.storage.db.utils import get_tmp_sqlite_db_url
 from snapflow.storage.file_system import FileSystemStorageApi
 from snapflow.storage.storage import (
     LOCAL_PYTHON_STORAGE,
@@ -48,6 +49,14 @@ def test_storage_api():
     assert isinstance(s, PythonStorageApi)
 
 
+def test_database_engine_is_shared():
+    url = get_tmp_sqlite_db_url()
+    s = Storage.from_url(url)
+    assert s.get_api().get_engine() is s.get_api().get_engine()
+    mem = Storage.from_url("sqlite://")
+    assert mem.get_api().get_engine() is not mem.get_api().get_engine()
+
+
 @pytest.mark.parametrize(
     "url",
     [
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 
+import pandas as pd
 import pytest
 from numpy import NaN
 from pandas import DataFrame
+from snapflow.storage.data_formats import Records
+from snapflow.testing.utils import DataInput
 from snapflow.utils.common import (
     SnapflowJSONEncoder,
     StringEnum,
@@ -13,13 +17,20 @@ from snapflow.utils.common import (
     snake_to_title_case,
     title_to_snake_case,
 )
-from snapflow.utils.data import is_nullish, with_header
+from snapflow.utils.data import (
+    is_nullish,
+    read_csv,
+    read_json_lines,
+    records_as_dict_of_lists,
+    with_header,
+)
 from snapflow.utils.pandas import (
     assert_dataframes_are_almost_equal,
     dataframe_to_records,
     empty_dataframe_for_schema,
+    records_to_dataframe,
 )
-from tests.utils import TestSchema4
+from tests.utils import TestSchema1, TestSchema4, make_test_env
 
 
 def test_snake_and_title_cases():
@@ -55,6 +66,8 @@ def test_is_datetime_str():
     assert not is_datetime_str("-157.0000001")
     assert not is_datetime_str("yesterday")
     assert not is_datetime_str("one day ago")
+    assert not is_datetime_str("")
+    assert not is_datetime_str("Monday")
     assert not is_datetime_str("2012")
     assert not is_datetime_str("20000101")
     assert not is_datetime_str("Pizza 2012-02-02")
@@ -81,6 +94,14 @@ def test_json_encoder():
     {"dt": "2012-01-01T00:00:00", "d": "2012-01-01", "t": "12:01:01", "td": "P1DT00H00M00S", "o": {"1": 2, "3": 4}, "s": "hello", "f": 0.1111111111111111, "e": "A"}
     """.strip()
     )
+    # Subclasses fall through to the isinstance checks
+    assert (
+        json.dumps(
+            [pd.Timestamp("2012-01-01", tz="UTC"), Decimal("1.10")],
+            cls=SnapflowJSONEncoder,
+        )
+        == '["2012-01-01T00:00:00Z", "1.10"]'
+    )
 
 
 def test_assert_dataframes_are_almost_equal():
@@ -105,6 +126,23 @@ def test_is_emptyish():
     assert not is_nullish(0)
     assert not is_nullish(".")
     assert not is_nullish("0")
+    assert is_nullish(float("nan"))
+    assert is_nullish(pd.NaT)
+    assert is_nullish(pd.NA)
+    assert not is_nullish(False)
+    assert not is_nullish([])
+    assert not is_nullish({})
+    assert not is_nullish(pd.Timestamp("2020-01-01"))
+
+
+def test_records_to_dataframe_columnar():
+    records: Records = [{"f1": "a", "f2": "1"}, {"f1": None, "f2": None}]
+    columns = records_as_dict_of_lists(records)
+    df = records_to_dataframe(columns, TestSchema4)
+    assert df["f1"].dtype.name == "string"
+    assert_dataframes_are_almost_equal(
+        df, records_to_dataframe(records, TestSchema4), TestSchema4
+    )
 
 
 def test_empty_dataframe_from_schema():
@@ -124,6 +162,11 @@ def test_dataframe_to_records():
         if r["a"] == 0:
             # NaT has been converted to None
             assert r["c"] is None
+    df["d"] = [1.5, None] * 5
+    records = dataframe_to_records(df)
+    assert records[1]["d"] is None
+    assert type(records[0]["a"]) is int
+    assert "c" in df and df["c"].hasnans  # Input frame is left untouched
 
 
 def test_with_header():
@@ -136,6 +179,49 @@ def test_with_header():
     assert list(i2hl[3]) == [0, 0, 1, 2, 3]
 
 
+def test_read_csv(tmp_path):
+    csv_str = 'a,b,c\n1,null,"x,y"\nNA,,z\n'
+    expected = [{"a": "1", "b": None, "c": "x,y"}, {"a": None, "b": None, "c": "z"}]
+    assert list(read_csv(csv_str.splitlines())) == expected
+    assert list(read_csv([ln.encode() for ln in csv_str.splitlines()])) == expected
+    pth = tmp_path / "test.csv"
+    pth.write_text(csv_str)
+    with open(pth, newline="") as f:
+        assert list(read_csv(f)) == expected
+
+
+def test_read_json_lines():
+    lines = ['{"a": 1, "b": {"c": null}}\n', "\n", '{"a": 2}\n']
+    assert read_json_lines(lines) == [{"a": 1, "b": {"c": None}}, {"a": 2}]
+    assert read_json_lines([]) == []
+    with pytest.raises(json.JSONDecodeError, match="Line 2"):
+        read_json_lines(['{"a": 1}', '{"a": }', '{"a": 3}'])
+    # Valid as one array, but not one value per line
+    with pytest.raises(json.JSONDecodeError, match="Line 2"):
+        read_json_lines(['{"a": 1}', '{"a": 2}, {"a": 3}'])
+    with pytest.raises(json.JSONDecodeError, match="Line 1"):
+        read_json_lines(["1, 2"])
+
+
+def test_records_as_dict_of_lists():
+    records = [{"a": 1}, {"a": 2, "b": 3}, {"b": 4}]
+    assert records_as_dict_of_lists(records) == {
+        "a": [1, 2, None],
+        "b": [None, 3, 4],
+    }
+
+
+def test_data_input_schema_resolved_once():
+    env = make_test_env()
+    di = DataInput("f1,f2\n1,2", schema="_test.TestSchema1")
+    with env.session_scope() as sess:
+        assert di.get_schema(env, sess) == TestSchema1
+        resolved = di._resolved_schema
+        di.as_dataframe(env, sess)
+        assert di._resolved_schema is resolved
+    assert di.get_schema_key() == "_test.TestSchema1"
+
+
 # def test_coerce_dataframe_to_schema():
 #     df = DataFrame({"f1": range(10), "f2": range(10)})
 #     df = coerce_dataframe_to_schema(df, TestSchema4)
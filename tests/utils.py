@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
 from pandas import DataFrame
 from snapflow.core.data_block import DataBlock
 from snapflow.core.environment import Environment
@@ -101,47 +104,51 @@ def pipe_multiple_input(
     pass
 
 
-sample_records = [
-    {
-        "a": "2017-02-17T15:09:26-08:00",
-        "b": "1/1/2020",
-        "c": "2020",
-        "d": [1, 2, 3],
-        "e": {1: 2},
-        "f": "1.3",
-        "g": 123,
-        "h": "null",
-        "i": None,
-    },
-    {
-        "a": "2017-02-17T15:09:26-08:00",
-        "b": "1/1/2020",
-        "c": "12",
-        "d": [1, 2, 3],
-        "e": {1: 2},
-        "f": "cookies",
-        "g": 123,
-        "h": "null",
-        "i": None,
-    },
-    {
-        "a": "2017-02-17T15:09:26-08:00",
-        "b": "30/30/2020",
-        "c": "12345",
-        "d": [1, 2, 3],
-        "e": "string",
-        "f": "true",
-        "g": 12345,
-        "h": "helloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworldhelloworld",
-    },
-    {
-        "a": None,
-        "b": None,
-        "c": None,
-        "d": None,
-        "e": None,
-        "f": None,
-        "g": None,
-        "i": None,
-    },
-]
+# Read-only, shared by every test that imports it
+sample_records: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(r)
+    for r in [
+        {
+            "a": "2017-02-17T15:09:26-08:00",
+            "b": "1/1/2020",
+            "c": "2020",
+            "d": [1, 2, 3],
+            "e": {1: 2},
+            "f": "1.3",
+            "g": 123,
+            "h": "null",
+            "i": None,
+        },
+        {
+            "a": "2017-02-17T15:09:26-08:00",
+            "b": "1/1/2020",
+            "c": "12",
+            "d": [1, 2, 3],
+            "e": {1: 2},
+            "f": "cookies",
+            "g": 123,
+            "h": "null",
+            "i": None,
+        },
+        {
+            "a": "2017-02-17T15:09:26-08:00",
+            "b": "30/30/2020",
+            "c": "12345",
+            "d": [1, 2, 3],
+            "e": "string",
+            "f": "true",
+            "g": 12345,
+            "h": "helloworld" * 30,
+        },
+        {
+            "a": None,
+            "b": None,
+            "c": None,
+            "d": None,
+            "e": None,
+            "f": None,
+            "g": None,
+            "i": None,
+        },
+    ]
+)